@@ -1,9 +1,8 @@
 import sys
-import random
+from mazegenerator import GENERATORS
 from mazegenerator.config_parser import ConfigPasrer
-from mazegenerator.mazegenerator import MazeGenerator
 from mazegenerator.display_maze import animate_generation, simple_menu_maze
-from mazegenerator.primalgo import PrimGenerator
+from mazegenerator.exporters import export
 
 # Direction constants
 NORTH = 1
@@ -23,14 +22,10 @@ def main() -> None:
     toparse = ConfigPasrer(sys.argv[1])
     toparse.parse()
 
-    # Set the random seed if provided
-    if toparse.parsed_dict['SEED'] is not None:
-        random.seed(toparse.parsed_dict['SEED'])
-
     try:
         # Choose generator class based on ALGO config
         algo = toparse.parsed_dict['ALGO']
-        gen_class = MazeGenerator if algo == "dfs" else PrimGenerator
+        gen_class = GENERATORS[algo]
         gen = gen_class(toparse.parsed_dict)
         # Embed the "42" pattern into the maze
         gen.set_42()
@@ -46,18 +41,36 @@ def main() -> None:
                 f"Error: EXIT {toparse.parsed_dict['EXIT']}"
                 " overlaps with the '42' pattern.")
             sys.exit(0)
-        # Animate maze generation in the terminal
-        animate_generation(gen, algo=algo, delay=15)
-        # Solve the maze using BFS
-        path = gen.solve_bfs(
+        headless = toparse.parsed_dict['HEADLESS']
+        if headless:
+            # Generate without curses (large mazes, batch jobs)
+            gen.generate()
+        else:
+            # Animate maze generation in the terminal
+            animate_generation(gen, algo=algo, delay=15)
+        # LOOP_RATIO can ask for more loops than the maze has room for
+        if gen.missing_loops:
+            print(
+                f"Warning: {gen.missing_loops} extra walls could not be "
+                "opened without leaving a 3x3 open area.")
+        # Solve the maze with the configured solver (BFS by default)
+        path = gen.solve(
             toparse.parsed_dict['ENTRY'], toparse.parsed_dict['EXIT'])
         if not path:
             print("Error: No path found between ENTRY and EXIT.")
             sys.exit(0)
         # Write maze and solution to output file
         gen.write_to_file(toparse.parsed_dict['OUTPUT_FILE'], path)
+        # Optionally render the solved maze as SVG, PNG or ANSI text
+        if toparse.parsed_dict['IMAGE_FILE'] is not None:
+            export(gen, path, toparse.parsed_dict['IMAGE_FILE'])
+        if headless:
+            print(
+                f"Maze {gen.width}x{gen.height} written to "
+                f"{toparse.parsed_dict['OUTPUT_FILE']}")
+            return
         # Launch the interactive menu
-        simple_menu_maze(gen, path, algo=algo)
+        simple_menu_maze(gen, path)
         return
 
     except Exception as e:
@@ -0,0 +1,223 @@
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from mazegenerator import EllerGenerator, MazeGenerator, PrimGenerator
+from mazegenerator.display_maze import SimpleDisplay
+
+# Maze sizes (width = height) swept by default; any size up to the headless
+# maximum can be passed on the command line
+SIZES = [20, 50, 200, 1000]
+
+# Seed used for every maze, so runs are comparable
+SEED = 42
+
+# Stored results compared against, and written by --save
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+# Runs of a step are timed in batches of at least MIN_SECONDS; the fastest
+# of REPEATS batches counts
+MIN_SECONDS = 0.2
+REPEATS = 3
+
+# Relative slowdown or memory growth reported as a regression
+TOLERANCE = 0.25
+
+
+# Config of a perfect maze of the given size
+def make_config(size: int) -> dict[str, Any]:
+    return {
+        'WIDTH': size, 'HEIGHT': size,
+        'ENTRY': (0, 0), 'EXIT': (size - 1, size - 1),
+        'OUTPUT_FILE': 'bench_maze.txt',
+        'PERFECT': True, 'SEED': SEED, 'ALGO': 'dfs',
+    }
+
+
+# Perfect DFS maze of the given size, generated and ready to use
+def make_maze(size: int) -> MazeGenerator:
+    gen = MazeGenerator(make_config(size))
+    gen.set_42()
+    gen.dfs_algo()
+    return gen
+
+
+# Each setup builds its input (not timed) and returns the step to time
+def setup_dfs(size: int) -> Callable[[], object]:
+    gen = MazeGenerator(make_config(size))
+    gen.set_42()
+    return gen.dfs_algo
+
+
+def setup_prim(size: int) -> Callable[[], object]:
+    gen = PrimGenerator(make_config(size))
+    gen.set_42()
+    return gen.prim_algo
+
+
+def setup_eller(size: int) -> Callable[[], object]:
+    gen = EllerGenerator(make_config(size))
+    gen.set_42()
+    return gen.eller_algo
+
+
+def setup_imperfect(size: int) -> Callable[[], object]:
+    gen = make_maze(size)
+    return lambda: gen.make_imperfect(int(size * size * gen.loop_ratio))
+
+
+def setup_solve(size: int) -> Callable[[], object]:
+    gen = make_maze(size)
+    return lambda: gen.solve_bfs((0, 0), (size - 1, size - 1))
+
+
+def setup_write(size: int) -> Callable[[], object]:
+    gen = make_maze(size)
+    path = gen.solve_bfs((0, 0), (size - 1, size - 1))
+
+    def write() -> None:
+        with open(os.devnull, 'wb') as f:
+            gen.write_to_file(f, path)
+    return write
+
+
+def setup_display(size: int) -> Callable[[], object]:
+    gen = make_maze(size)
+    sd = SimpleDisplay(gen, gen.solve_bfs((0, 0), (size - 1, size - 1)))
+    return sd._build_display
+
+
+# Benchmarked steps, in report order
+STEPS: dict[str, Callable[[int], Callable[[], object]]] = {
+    'dfs_algo': setup_dfs,
+    'prim_algo': setup_prim,
+    'eller_algo': setup_eller,
+    'make_imperfect': setup_imperfect,
+    'solve_bfs': setup_solve,
+    'write_to_file': setup_write,
+    'build_display': setup_display,
+}
+
+# Steps that change their maze, so every run needs a fresh input
+FRESH_INPUT = {'dfs_algo', 'prim_algo', 'eller_algo', 'make_imperfect'}
+
+
+# Total time of number runs of a step, each on its own input when fresh
+def time_runs(
+    setup: Callable[[int], Callable[[], object]],
+    size: int,
+    number: int,
+    fresh: bool,
+) -> float:
+    # Inputs are built before the clock starts.
+    if fresh:
+        steps = [setup(size) for _ in range(number)]
+    else:
+        steps = [setup(size)] * number
+    start = time.perf_counter()
+    for step in steps:
+        step()
+    return time.perf_counter() - start
+
+
+# Times one step, then runs it again under tracemalloc for its peak memory
+def measure(
+    setup: Callable[[int], Callable[[], object]], size: int, fresh: bool,
+) -> dict[str, float]:
+    # Like timeit's autorange: the number of runs per batch doubles until
+    # a batch takes MIN_SECONDS, then the fastest of REPEATS batches
+    # counts. tracemalloc slows allocations down, so timed runs go
+    # without it.
+    number = 1
+    batch = time_runs(setup, size, number, fresh)
+    while batch < MIN_SECONDS:
+        number *= 2
+        batch = time_runs(setup, size, number, fresh)
+    elapsed = batch / number
+    for _ in range(REPEATS - 1):
+        elapsed = min(elapsed, time_runs(setup, size, number, fresh) / number)
+
+    step = setup(size)
+    tracemalloc.start()
+    step()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'seconds': round(elapsed, 6),
+        'cells_per_sec': round(size * size / max(elapsed, 1e-9)),
+        'peak_kb': round(peak / 1024, 1),
+    }
+
+
+# Lists the results that are slower or use more memory than the baseline
+def regressions(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+) -> list[str]:
+    found = []
+    for key, result in results.items():
+        old = baseline.get(key)
+        if old is None:
+            continue
+        if result['cells_per_sec'] < old['cells_per_sec'] * (1 - TOLERANCE):
+            found.append(
+                f"{key}: {result['cells_per_sec']:.0f} cells/s, baseline "
+                f"{old['cells_per_sec']:.0f}")
+        if result['peak_kb'] > old['peak_kb'] * (1 + TOLERANCE):
+            found.append(
+                f"{key}: peak {result['peak_kb']:.1f} KiB, baseline "
+                f"{old['peak_kb']:.1f}")
+    return found
+
+
+# Runs every step over the size sweep and compares with the baseline
+def main() -> None:
+    args = sys.argv[1:]
+    save = '--save' in args
+    sizes = [int(arg) for arg in args if arg != '--save'] or SIZES
+
+    baseline: dict[str, dict[str, float]] = {}
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE) as f:
+            baseline = json.load(f)
+
+    print(
+        f"{'size':>11} {'step':>14} {'ms':>10} {'cells/s':>12} "
+        f"{'peak KiB':>10} {'vs base':>8}")
+    results: dict[str, dict[str, float]] = {}
+    for size in sizes:
+        for name, setup in STEPS.items():
+            key = f"{name}@{size}x{size}"
+            result = measure(setup, size, name in FRESH_INPUT)
+            results[key] = result
+            old = baseline.get(key)
+            ratio = ""
+            if old is not None:
+                speed = result['cells_per_sec'] / old['cells_per_sec']
+                ratio = f"{speed:.2f}x"
+            print(
+                f"{size:>5}x{size:<5} {name:>14} "
+                f"{result['seconds'] * 1000:>10.2f} "
+                f"{result['cells_per_sec']:>12.0f} "
+                f"{result['peak_kb']:>10.1f} {ratio:>8}", flush=True)
+
+    if save:
+        baseline.update(results)
+        with open(BASELINE_FILE, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"Baseline saved to {BASELINE_FILE}")
+        return
+
+    found = regressions(results, baseline)
+    for line in found:
+        print(f"REGRESSION {line}")
+    if found:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
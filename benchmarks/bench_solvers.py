@@ -0,0 +1,48 @@
+import sys
+import time
+from typing import Any
+
+from mazegenerator import GENERATORS, SOLVERS
+
+# Maze sizes (width, height) swept by the benchmark
+SIZES = [(50, 50), (200, 200), (500, 500)]
+
+
+# Generates one maze per algorithm/perfect flag and times every solver on it
+def main() -> None:
+    sizes = SIZES
+    if len(sys.argv) > 1:
+        sizes = [(int(n), int(n)) for n in sys.argv[1:]]
+
+    print(
+        f"{'size':>9} {'algo':>6} {'perfect':>7} {'solver':>8} "
+        f"{'expanded':>9} {'ms':>9} {'length':>7}")
+    for width, height in sizes:
+        for algo, gen_class in GENERATORS.items():
+            for perfect in (True, False):
+                config: dict[str, Any] = {
+                    'WIDTH': width, 'HEIGHT': height,
+                    'ENTRY': (0, 0), 'EXIT': (width - 1, height - 1),
+                    'OUTPUT_FILE': 'bench_maze.txt',
+                    'PERFECT': perfect, 'SEED': 42, 'ALGO': algo,
+                }
+                gen = gen_class(config)
+                gen.set_42()
+                gen.generate()
+
+                reference = gen.solve_bfs(config['ENTRY'], config['EXIT'])
+                for name, solver in SOLVERS.items():
+                    stats: dict[str, int] = {}
+                    start = time.perf_counter()
+                    path = solver(gen, config['ENTRY'], config['EXIT'], stats)
+                    elapsed = (time.perf_counter() - start) * 1000
+                    # Every solver must find a shortest path
+                    mark = "" if len(path) == len(reference) else " MISMATCH"
+                    print(
+                        f"{width:>4}x{height:<4} {algo:>6} {str(perfect):>7} "
+                        f"{name:>8} {stats.get('expanded', 0):>9} "
+                        f"{elapsed:>9.2f} {len(path):>7}{mark}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,28 @@
+from .maze_grid import MazeGrid
 from .mazegenerator import MazeGenerator
 from .primalgo import PrimGenerator
+from .elleralgo import EllerGenerator
 from .config_parser import ConfigPasrer
+from .solvers import SOLVERS
+from .maze_pool import MazePool
 from .display_maze import animate_generation, simple_menu_maze
 
+# Generator class for each ALGO config value
+GENERATORS: dict[str, type[MazeGenerator]] = {
+    "dfs": MazeGenerator,
+    "prim": PrimGenerator,
+    "eller": EllerGenerator,
+}
+
 __all__ = [
+    "MazeGrid",
     "MazeGenerator",
     "PrimGenerator",
+    "EllerGenerator",
+    "GENERATORS",
     "ConfigPasrer",
+    "SOLVERS",
+    "MazePool",
     "animate_generation",
     "simple_menu_maze",
 ]
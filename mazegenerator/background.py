@@ -0,0 +1,44 @@
+import threading
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class GenerationCancelled(Exception):
+    """Raised inside a generator whose cancel event was set."""
+
+
+class BackgroundTask(Generic[T]):
+    """Runs a function on a daemon thread. The function receives the
+    task's cancel event; its result or exception is kept for the caller."""
+
+    def __init__(self, target: Callable[[threading.Event], T]) -> None:
+        # Start the worker thread right away.
+        self.cancel_event = threading.Event()
+        self.result: Optional[T] = None
+        self.error: Optional[BaseException] = None
+        self._thread = threading.Thread(
+            target=self._run, args=(target,), daemon=True)
+        self._thread.start()
+
+    def _run(self, target: Callable[[threading.Event], T]) -> None:
+        # Keep the outcome instead of letting it die with the thread.
+        try:
+            self.result = target(self.cancel_event)
+        except BaseException as e:
+            self.error = e
+
+    def cancel(self) -> None:
+        # Ask the worker to stop at its next cancellation check.
+        self.cancel_event.set()
+
+    def done(self) -> bool:
+        return not self._thread.is_alive()
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        self._thread.join(timeout)
+
+    @property
+    def cancelled(self) -> bool:
+        # True when the worker stopped because of cancel().
+        return isinstance(self.error, GenerationCancelled)
@@ -0,0 +1,162 @@
+import argparse
+import math
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ProcessPoolExecutor, wait)
+from typing import Any, Iterator, Optional
+
+from mazegenerator import GENERATORS
+from mazegenerator.config_parser import ConfigPasrer
+from mazegenerator.exporters import export
+
+# Largest number of seeds handled by one worker task, so small mazes do not
+# pay one inter-process round trip each
+DEFAULT_CHUNK = 16
+
+# Outcome of one maze: seed, output file, path length, milliseconds
+Result = tuple[int, str, int, float]
+
+
+# Output file for one seed: maze.txt -> maze_<seed>.txt
+def seeded_name(filename: str, seed: int) -> str:
+    stem, ext = os.path.splitext(filename)
+    return f"{stem}_{seed}{ext}"
+
+
+# Seeds per task: about four tasks per worker so the load stays balanced,
+# at most DEFAULT_CHUNK
+def chunk_size(count: int, workers: Optional[int] = None) -> int:
+    workers = workers or os.cpu_count() or 1
+    return max(1, min(DEFAULT_CHUNK, math.ceil(count / (4 * workers))))
+
+
+# Generates, solves and writes the mazes of one chunk of seeds
+def _run_chunk(config: dict[str, Any], seeds: list[int]) -> list[Result]:
+    results: list[Result] = []
+    for seed in seeds:
+        start = time.perf_counter()
+        task_config = dict(config, SEED=seed)
+        task_config['OUTPUT_FILE'] = seeded_name(config['OUTPUT_FILE'], seed)
+        gen = GENERATORS[config['ALGO']](task_config)
+        gen.set_42()
+        gen.generate()
+        path = gen.solve(config['ENTRY'], config['EXIT'])
+        gen.write_to_file(task_config['OUTPUT_FILE'], path)
+        if config['IMAGE_FILE'] is not None:
+            export(gen, path, seeded_name(config['IMAGE_FILE'], seed))
+        results.append((
+            seed, task_config['OUTPUT_FILE'], len(path),
+            (time.perf_counter() - start) * 1000))
+    return results
+
+
+# Runs every seed on a process pool and yields results as they are ready
+def run_batch(
+    config: dict[str, Any],
+    seeds: list[int],
+    workers: Optional[int] = None,
+    chunk: Optional[int] = None,
+    ordered: bool = True,
+) -> Iterator[Result]:
+    # Each maze is seeded from its own seed, not from the worker, so the
+    # output does not depend on the worker count or scheduling. At most
+    # two chunks per worker are in flight; the next chunk is submitted as
+    # soon as one finishes. ordered=True yields in seed order, otherwise
+    # in completion order. chunk defaults to chunk_size().
+    if chunk is None:
+        chunk = chunk_size(len(seeds), workers)
+    if chunk < 1:
+        raise ValueError("chunk must be at least 1.")
+    chunks = deque(seeds[i:i + chunk] for i in range(0, len(seeds), chunk))
+    limit = 2 * (workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque[Future[list[Result]]] = deque()
+        while chunks and len(pending) < limit:
+            pending.append(pool.submit(_run_chunk, config, chunks.popleft()))
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                done = [f for f in pending if f in finished]
+                for future in done:
+                    pending.remove(future)
+            for future in done:
+                yield from future.result()
+                if chunks:
+                    pending.append(
+                        pool.submit(_run_chunk, config, chunks.popleft()))
+
+
+# Entry point: python3 -m mazegenerator.batch config.txt --count N
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python3 -m mazegenerator.batch",
+        description="Generate, solve and write many mazes in parallel.")
+    parser.add_argument("config", help="config file (same as a_maze_ing)")
+    parser.add_argument(
+        "--count", type=int, default=1, help="number of mazes (default 1)")
+    parser.add_argument(
+        "--seed", type=int, default=None,
+        help="first seed (default: SEED from the config, else 0)")
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="worker processes (default: CPU count)")
+    parser.add_argument(
+        "--chunk", type=int, default=None,
+        help="mazes per worker task (default: about count / (4 * workers),"
+        f" at most {DEFAULT_CHUNK})")
+    parser.add_argument(
+        "--unordered", action="store_true",
+        help="report mazes as they finish instead of in seed order")
+    args = parser.parse_args(argv)
+    if args.count < 1 or (args.chunk is not None and args.chunk < 1):
+        print("Error: --count and --chunk must be at least 1")
+        sys.exit(0)
+    if args.workers is not None and args.workers < 1:
+        print("Error: --workers must be at least 1")
+        sys.exit(0)
+
+    # Parse and validate the config once; workers get the parsed dict
+    toparse = ConfigPasrer(args.config)
+    toparse.parse()
+    config = toparse.parsed_dict
+    first = args.seed
+    if first is None:
+        first = config['SEED'] if config['SEED'] is not None else 0
+    seeds = list(range(first, first + args.count))
+
+    # ENTRY/EXIT against the "42" pattern only depends on the size
+    probe = GENERATORS[config['ALGO']](dict(config, SEED=None))
+    probe.set_42()
+    for key in ('ENTRY', 'EXIT'):
+        if config[key] in probe.reserved:
+            print(
+                f"Error: {key} {config[key]}"
+                " overlaps with the '42' pattern.")
+            sys.exit(0)
+
+    # One line per maze: seed, file, path length, milliseconds
+    start = time.perf_counter()
+    try:
+        for seed, filename, length, ms in run_batch(
+                config, seeds, args.workers, args.chunk,
+                ordered=not args.unordered):
+            print(f"{seed}\t{filename}\t{length}\t{ms:.1f}", flush=True)
+    except Exception as e:
+        print(e)
+        sys.exit(0)
+    print(
+        f"{args.count} mazes in {time.perf_counter() - start:.2f}s",
+        file=sys.stderr)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("CTRL C")
+        sys.exit(0)
@@ -2,6 +2,14 @@ import sys
 import os
 from typing import Any
 
+from mazegenerator.exporters import EXPORTERS
+from mazegenerator.solvers import SOLVERS
+
+# Largest WIDTH/HEIGHT accepted for the interactive curses viewer
+MAX_DIMENSION = 200
+# Largest WIDTH/HEIGHT accepted when HEADLESS=True (no curses at all)
+MAX_HEADLESS_DIMENSION = 100000
+
 
 # Class that reads a config file and validates all its fields
 class ConfigPasrer:
@@ -62,9 +70,15 @@ class ConfigPasrer:
                     "(WIDTH x HEIGHT)."
                 )
                 sys.exit(0)
-            # Maximum maze size is 200x200
-            if width_value > 200 or height_value > 200:
-                print("Error: Map dimensions must not exceed 200x200.")
+            # Maximum maze size is 200x200, lifted in headless mode
+            limit = MAX_DIMENSION
+            if parsed_dict.get('HEADLESS') is True:
+                limit = MAX_HEADLESS_DIMENSION
+            if width_value > limit or height_value > limit:
+                print(
+                    "Error: Map dimensions must not exceed "
+                    f"{limit}x{limit}."
+                )
                 sys.exit(0)
         except ValueError:
             print("Error: WIDTH and HEIGHT must be integers.")
@@ -75,8 +89,9 @@ class ConfigPasrer:
 
     # Checks for missing mandatory keys and collects unsupported bonus keys
     def val_keys(self, parsed_dict: dict[str, Any]) -> list[str]:
-        allowed_keys = ['WIDTH', 'HEIGHT', 'ENTRY',
-                        'EXIT', 'OUTPUT_FILE', 'PERFECT', 'ALGO']
+        allowed_keys = ['WIDTH', 'HEIGHT', 'ENTRY', 'EXIT', 'OUTPUT_FILE',
+                        'PERFECT', 'ALGO', 'HEADLESS', 'SOLVER',
+                        'IMAGE_FILE', 'LOOP_RATIO', 'BRAID']
         mandatory_keys = ['WIDTH', 'HEIGHT', 'ENTRY',
                           'EXIT', 'OUTPUT_FILE', 'PERFECT']
         bonus_keys = []
@@ -91,18 +106,33 @@ class ConfigPasrer:
                 sys.exit(0)
         return bonus_keys
 
-    # Validates that ALGO is either 'dfs' or 'prim'
+    # Validates that ALGO is 'dfs', 'prim' or 'eller'
     def val_algo(self, parsed_dict: dict[str, Any]) -> dict[str, Any]:
         algo = parsed_dict.get('ALGO', 'dfs')
         algo = str(algo).strip().lower()
 
-        if algo not in ('dfs', 'prim'):
-            print(f"Error: ALGO must be 'dfs' or 'prim'. Found '{algo}'.")
+        if algo not in ('dfs', 'prim', 'eller'):
+            print(
+                "Error: ALGO must be 'dfs', 'prim' or 'eller'. "
+                f"Found '{algo}'.")
             sys.exit(0)
 
         parsed_dict['ALGO'] = algo
         return parsed_dict
 
+    # Validates that SOLVER names a registered solver (defaults to 'bfs')
+    def val_solver(self, parsed_dict: dict[str, Any]) -> dict[str, Any]:
+        solver = str(parsed_dict.get('SOLVER', 'bfs')).strip().lower()
+
+        if solver not in SOLVERS:
+            print(
+                f"Error: SOLVER must be one of {', '.join(SOLVERS)}. "
+                f"Found '{solver}'.")
+            sys.exit(0)
+
+        parsed_dict['SOLVER'] = solver
+        return parsed_dict
+
     # Validates and converts PERFECT value from string to boolean
     def val_bool(self, parsed_dict: dict[str, Any]) -> dict[str, Any]:
         parsed_dict['PERFECT'] = parsed_dict['PERFECT'].strip().lower()
@@ -122,6 +152,52 @@ class ConfigPasrer:
             sys.exit(0)
             return parsed_dict
 
+    # Validates the optional HEADLESS flag (defaults to False)
+    def val_headless(self, parsed_dict: dict[str, Any]) -> dict[str, Any]:
+        value = str(parsed_dict.get('HEADLESS', 'false')).strip().lower()
+        if value not in ('true', 'false'):
+            print(
+                (
+                    "Error: HEADLESS must be 'True' or 'False'. "
+                    f"Found '{parsed_dict['HEADLESS']}'."
+                )
+            )
+            sys.exit(0)
+        parsed_dict['HEADLESS'] = value == 'true'
+        return parsed_dict
+
+    # Validates the optional LOOP_RATIO (0 to 1) and BRAID flag
+    def val_loops(self, parsed_dict: dict[str, Any]) -> dict[str, Any]:
+        ratio = parsed_dict.get('LOOP_RATIO')
+        if ratio is not None:
+            try:
+                ratio = float(ratio)
+            except ValueError:
+                ratio = -1.0
+            if not 0 <= ratio <= 1:
+                print(
+                    "Error: LOOP_RATIO must be a number between 0 and 1. "
+                    f"Found '{parsed_dict['LOOP_RATIO']}'.")
+                sys.exit(0)
+        parsed_dict['LOOP_RATIO'] = ratio
+        # A perfect maze has no loops to size
+        if ratio is not None and parsed_dict['PERFECT']:
+            print("Error: LOOP_RATIO requires PERFECT=False.")
+            sys.exit(0)
+
+        value = str(parsed_dict.get('BRAID', 'false')).strip().lower()
+        if value not in ('true', 'false'):
+            print(
+                "Error: BRAID must be 'True' or 'False'. "
+                f"Found '{parsed_dict['BRAID']}'.")
+            sys.exit(0)
+        parsed_dict['BRAID'] = value == 'true'
+        # A braid maze has loops everywhere, so it cannot be perfect
+        if parsed_dict['BRAID'] and parsed_dict['PERFECT']:
+            print("Error: BRAID=True requires PERFECT=False.")
+            sys.exit(0)
+        return parsed_dict
+
     # Validates that OUTPUT_FILE is a valid .txt file path
     def val_file(self, parsed_dict: dict[str, Any]) -> None:
         # does it end with .txt?
@@ -138,6 +214,24 @@ class ConfigPasrer:
             print("Error: Path doesn't exist for 'OUTPUT_FILE'")
             sys.exit(0)
 
+    # Validates the optional IMAGE_FILE (.svg, .png or .ans, or None)
+    def val_image_file(self, parsed_dict: dict[str, Any]) -> dict[str, Any]:
+        image = parsed_dict.get('IMAGE_FILE')
+        if image is None:
+            parsed_dict['IMAGE_FILE'] = None
+            return parsed_dict
+        ext = os.path.splitext(image)[1].lower()
+        if ext not in EXPORTERS:
+            print(
+                "Error: 'IMAGE_FILE' must end with "
+                f"{', '.join(EXPORTERS)}")
+            sys.exit(0)
+        path = os.path.dirname(image)
+        if path and (not os.path.exists(path)):
+            print("Error: Path doesn't exist for 'IMAGE_FILE'")
+            sys.exit(0)
+        return parsed_dict
+
     # Reads the config file and converts key=value lines into a dictionary
     def file_to_dict(self, filename: str) -> dict[str, Any]:
         try:
@@ -196,6 +290,9 @@ class ConfigPasrer:
         # Checking for missing or unsupported keys
         self.bon_keys = self.val_keys(self.parsed_dict)
 
+        # Headless mode decides the maximum allowed dimensions
+        self.parsed_dict = self.val_headless(self.parsed_dict)
+
         # Validting the values of HEIGHT AND WIDTH
         self.parsed_dict = self.val_dimensions(self.parsed_dict)
 
@@ -216,12 +313,15 @@ class ConfigPasrer:
             print("Error: 'ENTRY' and 'EXIT' coordinates cannot be the same!")
             sys.exit(0)
 
-        # Validating PERFECT boolean and ALGO values
+        # Validating PERFECT boolean, ALGO and SOLVER values
         self.parsed_dict = self.val_bool(self.parsed_dict)
         self.parsed_dict = self.val_algo(self.parsed_dict)
+        self.parsed_dict = self.val_solver(self.parsed_dict)
+        self.parsed_dict = self.val_loops(self.parsed_dict)
 
-        # Validating the output file path
+        # Validating the output file and optional image paths
         self.val_file(self.parsed_dict)
+        self.parsed_dict = self.val_image_file(self.parsed_dict)
 
         # Handling optional SEED key from bonus keys
         if 'SEED' in self.bon_keys:
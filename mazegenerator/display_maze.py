@@ -1,5 +1,11 @@
 import curses
-from typing import TYPE_CHECKING, Any
+import threading
+from itertools import groupby
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Union
+
+from mazegenerator.background import BackgroundTask
+from mazegenerator.maze_pool import MazePool
+from mazegenerator.scheduler import AnimationScheduler, animation_duration
 
 if TYPE_CHECKING:
     from mazegenerator import MazeGenerator
@@ -13,14 +19,97 @@ RESERVED = 2
 ENTRY_T = 3
 EXIT_T = 4
 PATH = 5
+
+# Color pair used to paint each display cell type
+TYPE_TO_PAIR = {
+    WALL: 1,
+    PASSAGE: 0,
+    RESERVED: 2,
+    ENTRY_T: 3,
+    EXIT_T: 4,
+    PATH: 5
+}
+
+# (dx, dy) of the neighbor behind each wall side
+SIDE_D = {N: (0, -1), S: (0, 1), E: (1, 0), W: (-1, 0)}
+
+# Character per display cell type for SimpleDisplay.to_text
+TEXT_CHARS = b"# 4EX."
+
+# Wall bit tables: cell value -> 1 if that wall is up, else 0
+WALL_BIT = {
+    side: bytes(1 if v & side else 0 for v in range(256))
+    for side in (N, E, S, W)
+}
+
+# Cell type from (path bit | reserved bit << 1); the path wins
+CELL_TYPE = bytes(
+    PATH if v & 1 else RESERVED if v & 2 else PASSAGE for v in range(256))
+
+
+def _edge_type(code: int) -> int:
+    # Inner side from (wall << 6 | type1 << 3 | type2), as in _side_type.
+    if code & 64:
+        return WALL
+    t1, t2 = (code >> 3) & 7, code & 7
+    if t1 == RESERVED and t2 == RESERVED:
+        return RESERVED
+    if t1 in (PATH, ENTRY_T, EXIT_T) and t2 in (PATH, ENTRY_T, EXIT_T):
+        return PATH
+    return PASSAGE
+
+
+EDGE_TYPE = bytes(_edge_type(v) for v in range(256))
+
+# Border side from (wall << 6 | cell type): a hole shows the cell type
+BORDER_TYPE = bytes(WALL if v & 64 else v & 7 for v in range(256))
+
+# Corner fixing: each neighbor sets bit 0 if it is a wall, bit 1 if it is
+# open but not reserved; the OR of the four picks the corner type
+CORNER_CLASS = bytes(
+    1 if v == WALL else 0 if v == RESERVED else 2 for v in range(256))
+CORNER_TYPE = bytes(
+    WALL if v & 1 else PASSAGE if v & 2 else RESERVED for v in range(256))
+
+# Zoom-out: one screen cell shows up to MAX_ZOOM x MAX_ZOOM display cells
+MAX_ZOOM = 15
+# Flag per special type; a zoomed block shows the first one it contains
+ZOOM_FLAG = bytes(
+    {ENTRY_T: 1, EXIT_T: 2, PATH: 4, RESERVED: 8}.get(v, 0)
+    for v in range(256))
+IS_WALL = bytes(1 if v == WALL else 0 for v in range(256))
+# Block type from (flags | wall majority << 4)
+ZOOM_TYPE = bytes(
+    ENTRY_T if v & 1 else EXIT_T if v & 2 else PATH if v & 4
+    else RESERVED if v & 8 else WALL if v & 16 else PASSAGE
+    for v in range(256))
+
+# Colors of (walls, 42, entry, exit, path) for each theme
+THEMES = [
+    (curses.COLOR_WHITE, curses.COLOR_MAGENTA,
+     curses.COLOR_GREEN, curses.COLOR_RED, curses.COLOR_YELLOW),
+    (curses.COLOR_CYAN, curses.COLOR_BLUE, curses.COLOR_GREEN,
+     curses.COLOR_RED, curses.COLOR_WHITE),
+    (curses.COLOR_YELLOW, curses.COLOR_MAGENTA,
+     curses.COLOR_CYAN, curses.COLOR_RED, curses.COLOR_GREEN),
+]
+
 MENU_LINES = [
     "=== A-Maze-ing ===",
     "1. Re-generate a new maze",
     "2. Show/hide path",
     "3. Rotate maze colors",
     "4. Quit",
+    "Arrows: scroll, +/-: zoom (large mazes)",
+    "While animating: space skips, c/Esc cancels",
 ]
 
+# Milliseconds between frames drawn while a background task runs
+FRAME_MS = 33
+
+# Keys that cancel a regeneration running in the background
+CANCEL_KEYS = (ord('c'), 27)
+
 
 class SimpleDisplay:
     """Minimal maze renderer — walls, passages, and reserved (42) cells."""
@@ -29,11 +118,54 @@ class SimpleDisplay:
         self, maze_gen: 'MazeGenerator', path: list[tuple[int, int]]
     ) -> None:
         # Store the maze data, solved path, and current color theme state.
-        self.path = path
         self.maze = maze_gen
+        self.path = path
         self.reserved: set[tuple[int, int]] = getattr(
             maze_gen, 'reserved', set())
         self.theme_index = 0  # them dyal lcolors
+        # Last built display matrix, patched in place by update_cells
+        self.display: Optional[list[bytearray]] = None
+        # Viewport used when the maze does not fit the terminal: first
+        # display row/column shown and display cells per screen cell
+        self.top = 0
+        self.left = 0
+        self.zoom = 1
+
+    @property
+    def path(self) -> list[tuple[int, int]]:
+        return self._path
+
+    @path.setter
+    def path(self, path: list[tuple[int, int]]) -> None:
+        # Keep one byte per maze cell set to 1 on the path, so membership
+        # checks do not scan the path list.
+        self._path = list(path)
+        self.path_mask = bytearray(self.maze.width * self.maze.height)
+        for x, y in path:
+            self.path_mask[y * self.maze.width + x] = 1
+
+    def set_path(
+        self, path: list[tuple[int, int]]
+    ) -> set[tuple[int, int]]:
+        # Replace the shown path; only cells entering or leaving it are
+        # patched in the cached display. Returns the changed display cells.
+        w = self.maze.width
+        touched = {y * w + x for x, y in self._path}
+        touched.update(y * w + x for x, y in path)
+        self.path = path
+        if self.display is None:
+            return set()
+        return self.update_cells(touched)
+
+    def add_path_cell(self, cell: tuple[int, int]) -> set[tuple[int, int]]:
+        # Append one cell to the shown path; return the display cells that
+        # changed if a display is cached.
+        self._path.append(cell)
+        cell_id = cell[1] * self.maze.width + cell[0]
+        self.path_mask[cell_id] = 1
+        if self.display is None:
+            return set()
+        return self.update_cells([cell_id])
 
     def _cell_type(self, x: int, y: int) -> int:
         # Determine the visual type for a single maze cell.
@@ -43,141 +175,297 @@ class SimpleDisplay:
             return ENTRY_T
         if (x, y) == exit:
             return EXIT_T
-        if (x, y) in self.path:
+        if self.path_mask[y * self.maze.width + x]:
             return PATH
         if (x, y) in self.reserved:
             return RESERVED
         return PASSAGE
 
-    def _build_display(self) -> list[list[int]]:
+    def _build_display(
+        self, first: int = 0, last: Optional[int] = None
+    ) -> list[bytearray]:
         """Build a (2H+1) x (2W+1) grid: WALL, PASSAGE, or RESERVED."""
+        # Each display row is a bytearray assembled with slice assignments;
+        # per-cell decisions are table lookups (bytes.translate) over codes
+        # packed from whole rows at once, so Python only loops over rows.
+        # Only display rows first..last-1 are built and returned, plus the
+        # maze rows around them that their corners depend on.
         h = self.maze.height
         w = self.maze.width
-        grid = self.maze.grid  # data of maze
-        rows = 2 * h + 1
+        cells = self.maze.grid.cells  # data of maze, flat y * w + x
         cols = 2 * w + 1
-
-        disp = [[WALL] * cols for _ in range(rows)]  # matrix of walls
-
-        # Cell interiors
-        for y in range(h):
-            for x in range(w):
-                disp[2 * y + 1][2 * x + 1] = self._cell_type(x, y)
-
-        # Internal edges
+        if last is None or last > 2 * h + 1:
+            last = 2 * h + 1
+        first = max(0, min(first, last))
+        y_start = max(0, first // 2 - 1)
+        y_stop = min(h, last // 2 + 1)
+        t_start = max(0, y_start - 1)
+        types = self._cell_types(t_start, min(h, y_stop + 1))
+
+        def row_of(y: int) -> tuple[bytearray, bytearray]:
+            start = (y - t_start) * w
+            return types[start:start + w], cells[y * w:(y + 1) * w]
+
+        def edge_above(y: int) -> bytearray:
+            # Edge row 2y: north sides of row y, or a border
+            edge = bytearray([WALL]) * cols
+            if y == 0 or y == h:
+                row_types, row_cells = row_of(0 if y == 0 else h - 1)
+                side = N if y == 0 else S
+                edge[1::2] = _or_shifted(
+                    (row_types, 0), (row_cells.translate(WALL_BIT[side]), 6)
+                ).translate(BORDER_TYPE)
+            else:
+                above_types, above_cells = row_of(y - 1)
+                edge[1::2] = _or_shifted(
+                    (above_types, 3), (row_of(y)[0], 0),
+                    (above_cells.translate(WALL_BIT[S]), 6),
+                ).translate(EDGE_TYPE)
+            return edge
+
+        disp = []
+        for y in range(y_start, y_stop):
+            row_types, row_cells = row_of(y)
+            disp.append(edge_above(y))
+
+            # Interior row: cells at odd columns, east/west sides between
+            inner = bytearray([WALL]) * cols
+            inner[1::2] = row_types
+            inner[2:cols - 1:2] = _or_shifted(
+                (row_types[:-1], 3), (row_types[1:], 0),
+                (row_cells[:-1].translate(WALL_BIT[E]), 6),
+            ).translate(EDGE_TYPE)
+            if not row_cells[0] & W:
+                inner[0] = row_types[0]
+            if not row_cells[-1] & E:
+                inner[cols - 1] = row_types[-1]
+            disp.append(inner)
+        disp.append(edge_above(y_stop))
+
+        # Fix corners surrounded by non-walls: OR the class of the four
+        # display cells around each inner corner of an edge row
+        for dy in range(2, len(disp) - 1, 2):
+            up, down, edge = disp[dy - 1], disp[dy + 1], disp[dy]
+            edge[2:cols - 1:2] = _or_shifted(
+                (up[2:cols - 1:2].translate(CORNER_CLASS), 0),
+                (down[2:cols - 1:2].translate(CORNER_CLASS), 0),
+                (edge[1:cols - 2:2].translate(CORNER_CLASS), 0),
+                (edge[3:cols:2].translate(CORNER_CLASS), 0),
+            ).translate(CORNER_TYPE)
+
+        offset = first - 2 * y_start
+        return disp[offset:offset + last - first]
+
+    def _cell_types(self, y_start: int = 0, y_stop: int = -1) -> bytearray:
+        # Display type of every maze cell in rows y_start..y_stop-1, flat,
+        # with the same precedence as _cell_type: entry, exit, path,
+        # reserved, passage.
+        w = self.maze.width
+        if y_stop < 0:
+            y_stop = self.maze.height
+        reserved = bytearray(w * (y_stop - y_start))
+        for x, y in self.reserved:
+            if y_start <= y < y_stop:
+                reserved[(y - y_start) * w + x] = 1
+        types = bytearray(_or_shifted(
+            (self.path_mask[y_start * w:y_stop * w], 0), (reserved, 1)
+        ).translate(CELL_TYPE))
+        exit = self.maze.config['EXIT']
+        entry = self.maze.config['ENTRY']
+        for (x, y), kind in ((exit, EXIT_T), (entry, ENTRY_T)):
+            if 0 <= x < w and y_start <= y < y_stop:
+                types[(y - y_start) * w + x] = kind
+        return types
+
+    def iter_display_rows(self, block: int = 256) -> Iterator[bytearray]:
+        # Yield display rows top to bottom, building block rows at a time
+        # so exports of huge mazes never hold the whole matrix.
+        total = 2 * self.maze.height + 1
+        for first in range(0, total, block):
+            yield from self._build_display(first, first + block)
+
+    def to_text(self, chars: bytes = TEXT_CHARS) -> str:
+        # Export the display as text, one character per display cell picked
+        # by type from chars (WALL, PASSAGE, RESERVED, ENTRY, EXIT, PATH).
+        if self.display is None:
+            self.display = self._build_display()
+        table = bytes(chars[t] if t < len(chars) else 32 for t in range(256))
+        return "\n".join(
+            row.translate(table).decode("latin-1") for row in self.display)
+
+    def _side_type(self, x: int, y: int, side: int) -> int:
+        # Display type of one side of cell (x, y), same rules as the full
+        # build: border holes take the cell type, inner passages are PATH
+        # or RESERVED when both cells are, PASSAGE otherwise.
+        w = self.maze.width
+        cells = self.maze.grid.cells
+        dx, dy = SIDE_D[side]
+        nx, ny = x + dx, y + dy
+        if not (0 <= nx < w and 0 <= ny < self.maze.height):
+            if cells[y * w + x] & side:
+                return WALL
+            return self._cell_type(x, y)
+        # Inner walls are read from the west/north cell, like _build_display
+        if side in (N, W):
+            if cells[ny * w + nx] & (S if side == N else E):
+                return WALL
+        elif cells[y * w + x] & side:
+            return WALL
+        t1 = self._cell_type(x, y)
+        t2 = self._cell_type(nx, ny)
+        if t1 == RESERVED and t2 == RESERVED:
+            return RESERVED
         path_nodes = (PATH, ENTRY_T, EXIT_T)
-        for y in range(h):
-            for x in range(w):
-                cell = grid[y][x]
-                if x + 1 < w and not (cell & E):  # jiha dyal liman
-                    t1 = self._cell_type(x, y)
-                    t2 = self._cell_type(x + 1, y)
-                    if t1 == RESERVED and t2 == RESERVED:
-                        disp[2 * y + 1][2 * (x + 1)] = RESERVED
-                    elif t1 in path_nodes and t2 in path_nodes:
-                        disp[2 * y + 1][2 * (x + 1)] = PATH
-                    else:
-                        disp[2 * y + 1][2 * (x + 1)] = PASSAGE
-                if y + 1 < h and not (cell & S):  # jiha dyal ltaht
-                    t1 = self._cell_type(x, y)
-                    t2 = self._cell_type(x, y + 1)
-                    if t1 == RESERVED and t2 == RESERVED:
-                        disp[2 * (y + 1)][2 * x + 1] = RESERVED
-                    elif t1 in path_nodes and t2 in path_nodes:
-                        disp[2 * (y + 1)][2 * x + 1] = PATH
-                    else:
-                        disp[2 * (y + 1)][2 * x + 1] = PASSAGE
-
-        # Border openings (entry / exit holes) lbiban dyal jnab
-        for y in range(h):
-            for x in range(w):
-                cell = grid[y][x]
-                ct = self._cell_type(x, y)
-                if y == 0 and not (cell & N):
-                    disp[0][2 * x + 1] = ct
-                if y == h - 1 and not (cell & S):
-                    disp[2 * h][2 * x + 1] = ct
-                if x == 0 and not (cell & W):
-                    disp[2 * y + 1][0] = ct
-                if x == w - 1 and not (cell & E):
-                    disp[2 * y + 1][2 * w] = ct
-
-        # Fix corners surrounded by non-walls
-        for dy in range(rows):
-            for dx in range(cols):
-                if dy % 2 == 0 and dx % 2 == 0 and disp[dy][dx] == WALL:
-                    adj_types = []
-                    all_open = True
-                    for ady, adx in [(dy - 1, dx), (dy + 1, dx),
-                                     (dy, dx - 1), (dy, dx + 1)]:
-                        if 0 <= ady < rows and 0 <= adx < cols:
-                            if disp[ady][adx] == WALL:
-                                all_open = False
-                                break
-                            adj_types.append(disp[ady][adx])
-                        else:
-                            all_open = False
-                            break
-                    if all_open and adj_types:
-                        if all(t == RESERVED for t in adj_types):
-                            disp[dy][dx] = RESERVED
-                        else:
-                            disp[dy][dx] = PASSAGE
-
-        return disp
-
-    def _init_colors(self) -> None:
-        # Initialize curses colors for the currently selected theme.
-        curses.curs_set(0)
-        curses.start_color()
-        curses.use_default_colors()
-
-        themes = [
-            (curses.COLOR_WHITE, curses.COLOR_MAGENTA,
-             curses.COLOR_GREEN, curses.COLOR_RED, curses.COLOR_YELLOW),
-            (curses.COLOR_CYAN, curses.COLOR_BLUE, curses.COLOR_GREEN,
-             curses.COLOR_RED, curses.COLOR_WHITE),
-            (curses.COLOR_YELLOW, curses.COLOR_MAGENTA,
-             curses.COLOR_CYAN, curses.COLOR_RED, curses.COLOR_GREEN),
-        ]
+        if t1 in path_nodes and t2 in path_nodes:
+            return PATH
+        return PASSAGE
 
-        wall_c, reserved_c, entry_c, exit_c, path_c = themes[
-            self.theme_index % len(themes)
-        ]
+    def _corner_type(self, disp: list[bytearray], dy: int, dx: int) -> int:
+        # A corner is open only when all four display cells around it are.
+        adj_types = []
+        for ady, adx in [(dy - 1, dx), (dy + 1, dx),
+                         (dy, dx - 1), (dy, dx + 1)]:
+            if not (0 <= ady < len(disp) and 0 <= adx < len(disp[0])):
+                return WALL
+            if disp[ady][adx] == WALL:
+                return WALL
+            adj_types.append(disp[ady][adx])
+        if all(t == RESERVED for t in adj_types):
+            return RESERVED
+        return PASSAGE
 
-        curses.init_pair(1, wall_c, wall_c)          # walls
-        curses.init_pair(2, reserved_c, reserved_c)  # 42
-        curses.init_pair(3, entry_c, entry_c)        # entry
-        curses.init_pair(4, exit_c, exit_c)          # exit
-        curses.init_pair(5, path_c, path_c)          # path
+    def update_cells(self, cell_ids: Iterable[int]) -> set[tuple[int, int]]:
+        # Recompute the interior, four sides and four corners of each given
+        # maze cell in the cached display; return the display cells that
+        # changed. Without a cached display (the viewport draws only its
+        # visible rows) there is nothing to patch.
+        if self.display is None:
+            return set()
+        disp = self.display
+        w = self.maze.width
+        changed: set[tuple[int, int]] = set()
+        corners = set()
+
+        for cell in set(cell_ids):
+            y, x = divmod(cell, w)
+            cy, cx = 2 * y + 1, 2 * x + 1
+            updates = [((cy, cx), self._cell_type(x, y))]
+            for side, (dx, dy) in SIDE_D.items():
+                updates.append(
+                    ((cy + dy, cx + dx), self._side_type(x, y, side)))
+            for (dy, dx), value in updates:
+                if disp[dy][dx] != value:
+                    disp[dy][dx] = value
+                    changed.add((dy, dx))
+            for dy in (cy - 1, cy + 1):
+                for dx in (cx - 1, cx + 1):
+                    corners.add((dy, dx))
+
+        for dy, dx in corners:
+            value = self._corner_type(disp, dy, dx)
+            if disp[dy][dx] != value:
+                disp[dy][dx] = value
+                changed.add((dy, dx))
+        return changed
+
+    def _paint(
+        self, stdscr: curses.window, coords: Iterable[tuple[int, int]]
+    ) -> None:
+        # Repaint only the given display cells of the cached display.
+        if self._use_viewport(stdscr):
+            self._draw_viewport(stdscr)
+            return
+        if self.display is None:
+            return
+        attrs = renderer_for(stdscr).attrs
+        for dy, dx in coords:
+            try:
+                stdscr.addstr(dy, dx * 2, "  ", attrs[self.display[dy][dx]])
+            except curses.error:
+                pass
+
+    def _init_colors(self, stdscr: curses.window) -> None:
+        # Select this display's theme; the pairs are only redefined when
+        # the session's theme actually changes.
+        renderer_for(stdscr).set_theme(self.theme_index)
 
     def _draw_frame(self, stdscr: curses.window) -> int:
         # Render the maze on screen and return the number of drawn rows.
-        type_to_pair = {
-            WALL: 1,
-            PASSAGE: 0,
-            RESERVED: 2,
-            ENTRY_T: 3,
-            EXIT_T: 4,
-            PATH: 5
-        }
-
+        if self._use_viewport(stdscr):
+            stdscr.erase()
+            return self._draw_viewport(stdscr)
         stdscr.clear()
         display = self._build_display()
+        self.display = display
         rows = len(display)
+        attrs = renderer_for(stdscr).attrs
 
         for dy in range(rows):
             for dx in range(len(display[dy])):
-                pair = type_to_pair.get(display[dy][dx], 0)
                 try:
-                    stdscr.addstr(dy, dx * 2, "  ", curses.color_pair(pair))
+                    stdscr.addstr(dy, dx * 2, "  ", attrs[display[dy][dx]])
                 except curses.error:
                     pass
         return rows
 
+    def _view_size(self, stdscr: curses.window) -> tuple[int, int]:
+        # Screen cells available for the maze: rows above the menu, and
+        # columns at two characters per cell.
+        max_y, max_x = stdscr.getmaxyx()
+        return max(1, max_y - len(MENU_LINES) - 1), max(1, max_x // 2)
+
+    def _use_viewport(self, stdscr: curses.window) -> bool:
+        # Draw through the viewport when zoomed out or when the maze is
+        # larger than the terminal.
+        view_h, view_w = self._view_size(stdscr)
+        return (
+            self.zoom > 1
+            or 2 * self.maze.height + 1 > view_h
+            or 2 * self.maze.width + 1 > view_w
+        )
+
+    def scroll(self, stdscr: curses.window, rows: int, cols: int) -> None:
+        # Move the viewport by a number of screen cells, kept in bounds.
+        view_h, view_w = self._view_size(stdscr)
+        z = self.zoom
+        bottom = 2 * self.maze.height + 1 - view_h * z
+        right = 2 * self.maze.width + 1 - view_w * z
+        self.top = max(0, min(self.top + rows * z, bottom))
+        self.left = max(0, min(self.left + cols * z, right))
+
+    def set_zoom(self, stdscr: curses.window, zoom: int) -> None:
+        # Change the zoom level, keeping the viewport in bounds.
+        self.zoom = max(1, min(zoom, MAX_ZOOM))
+        self.scroll(stdscr, 0, 0)
+
+    def _draw_viewport(self, stdscr: curses.window) -> int:
+        # Build and draw only the display rows and columns inside the
+        # viewport; zoomed out, each screen cell stands for a zoom x zoom
+        # block of display cells. Returns the number of screen rows used.
+        view_h, view_w = self._view_size(stdscr)
+        z = self.zoom
+        rows = self._build_display(self.top, self.top + view_h * z)
+        span = slice(self.left, self.left + view_w * z)
+        attrs = renderer_for(stdscr).attrs
+        drawn = 0
+        for sy in range(0, len(rows), z):
+            block = [row[span] for row in rows[sy:sy + z]]
+            line = block[0] if z == 1 else _zoom_rows(block, z)
+            sx = 0
+            for kind, run in groupby(line):
+                width = len(list(run))
+                try:
+                    stdscr.addstr(
+                        drawn, sx * 2, "  " * width, attrs[kind])
+                except curses.error:
+                    pass
+                sx += width
+            drawn += 1
+        return drawn
+
     def draw(self, stdscr: curses.window) -> None:
         # Draw the full maze once and wait for the user to press a key.
-        self._init_colors()
+        self._init_colors(stdscr)
         rows = self._draw_frame(stdscr)
 
         try:
@@ -190,17 +478,19 @@ class SimpleDisplay:
 
     def animate_draw(self, stdscr: curses.window, delay: float = 0.2) -> None:
         # Reveal the solution path progressively before showing the menu.
-        self._init_colors()
+        self._init_colors(stdscr)
 
         original_path = list(self.path)
         self.path = []
+        rows = self._draw_frame(stdscr)
+        stdscr.refresh()
 
-        rows = 0
+        # Each frame only repaints the cells the new path cell changed
         for cell in original_path:
-            self.path.append(cell)
-            rows = self._draw_frame(stdscr)
+            self._paint(stdscr, self.add_path_cell(cell))
 
-            stdscr.refresh()
+            stdscr.noutrefresh()
+            curses.doupdate()
             curses.napms(int(delay * 1000))
 
         try:
@@ -212,51 +502,238 @@ class SimpleDisplay:
         stdscr.getch()
 
 
+def _zoom_rows(block: list[bytearray], z: int) -> bytes:
+    # Collapse up to z display rows into one row of z x z blocks: a block
+    # shows the most important special type it holds, otherwise WALL when
+    # walls are the majority and PASSAGE when they are not.
+    size = (len(block[0]) + z - 1) // z
+    flags = 0
+    walls = 0
+    for row in block:
+        padded = row + bytes([WALL]) * (size * z - len(row))
+        for off in range(z):
+            part = padded[off::z]
+            flags |= int.from_bytes(part.translate(ZOOM_FLAG), "little")
+            walls += int.from_bytes(part.translate(IS_WALL), "little")
+    count = len(block) * z
+    majority = bytes(16 if 2 * c > count else 0 for c in range(256))
+    return _or_shifted(
+        (flags.to_bytes(size, "little"), 0),
+        (walls.to_bytes(size, "little").translate(majority), 0),
+    ).translate(ZOOM_TYPE)
+
+
+# Viewport direction (rows, cols) for each arrow key
+SCROLL_KEYS = {
+    curses.KEY_UP: (-1, 0),
+    curses.KEY_DOWN: (1, 0),
+    curses.KEY_LEFT: (0, -1),
+    curses.KEY_RIGHT: (0, 1),
+}
+
+
+def _or_shifted(*parts: tuple[Union[bytes, bytearray], int]) -> bytes:
+    # Bytewise OR of equally long byte strings, each shifted left by the
+    # given number of bits; shifted values must still fit in a byte.
+    size = len(parts[0][0])
+    acc = 0
+    for part, shift in parts:
+        acc |= int.from_bytes(part, "little") << shift
+    return acc.to_bytes(size, "little")
+
+
 def _draw_menu(stdscr: curses.window, start_row: int) -> None:
     # Display the available keyboard actions under the maze.
     for i, line in enumerate(MENU_LINES):
         stdscr.addstr(start_row + i, 0, line)
 
 
+class CursesRenderer:
+    """Curses state of one screen session: color setup, the active theme
+    and the display reused across generation frames."""
+
+    def __init__(self, stdscr: curses.window) -> None:
+        # One-time setup of the session; pairs follow in set_theme.
+        self.stdscr = stdscr
+        curses.curs_set(0)
+        curses.start_color()
+        curses.use_default_colors()
+        # Attribute to draw each display cell type with
+        self.attrs = [0] * 256
+        for kind, pair in TYPE_TO_PAIR.items():
+            self.attrs[kind] = curses.color_pair(pair)
+        self.theme_index: Optional[int] = None
+        self.view: Optional[SimpleDisplay] = None
+
+    def set_theme(self, theme_index: int) -> None:
+        # Redefine the color pairs, only when the theme really changes.
+        # Cells already on screen take the new colors on the next refresh.
+        theme_index %= len(THEMES)
+        if theme_index == self.theme_index:
+            return
+        wall_c, reserved_c, entry_c, exit_c, path_c = THEMES[theme_index]
+        curses.init_pair(1, wall_c, wall_c)          # walls
+        curses.init_pair(2, reserved_c, reserved_c)  # 42
+        curses.init_pair(3, entry_c, entry_c)        # entry
+        curses.init_pair(4, exit_c, exit_c)          # exit
+        curses.init_pair(5, path_c, path_c)          # path
+        self.theme_index = theme_index
+
+    def generation_frame(
+        self, maze_gen: 'MazeGenerator', theme_index: int = 0
+    ) -> None:
+        # Draw one frame of the maze generation process. The first frame
+        # of a maze paints everything and starts dirty-cell tracking; later
+        # frames repaint only the cells reported since the last one.
+        # The generator may run on another thread: tracking starts before
+        # the full paint reads the grid, and only the ids taken from the
+        # dirty list are removed from it.
+        stdscr = self.stdscr
+        self.set_theme(theme_index)
+        sd = self.view
+        dirty = maze_gen.dirty
+        if (
+            sd is None
+            or sd.maze is not maze_gen
+            or dirty is None
+            or len(dirty) > maze_gen.width * maze_gen.height
+        ):
+            maze_gen.dirty = []
+            sd = SimpleDisplay(maze_gen, path=[])
+            sd.theme_index = theme_index
+            rows = sd._draw_frame(stdscr)
+            try:
+                _draw_menu(stdscr, rows + 1)
+            except curses.error:
+                pass
+            self.view = sd
+            stdscr.refresh()
+            return
+
+        changed = dirty[:]
+        del dirty[:len(changed)]
+        if sd._use_viewport(stdscr):
+            # Only the visible rows are built, straight from the grid
+            if changed:
+                sd._draw_viewport(stdscr)
+        else:
+            sd._paint(stdscr, sd.update_cells(changed))
+        stdscr.noutrefresh()
+        curses.doupdate()
+
+
+# Renderer of the current curses session
+_session: dict[str, CursesRenderer] = {}
+
+
+def renderer_for(stdscr: curses.window) -> CursesRenderer:
+    # Return the renderer of this screen, starting one for a new session.
+    renderer = _session.get('renderer')
+    if renderer is None or renderer.stdscr is not stdscr:
+        renderer = CursesRenderer(stdscr)
+        _session['renderer'] = renderer
+    return renderer
+
+
 def draw_generation_frame(
     stdscr: curses.window,
     maze_gen: 'MazeGenerator',
     theme_index: int = 0,
 ) -> None:
     # Draw one frame of the maze generation process.
-    sd = SimpleDisplay(maze_gen, path=[])
-    sd.theme_index = theme_index
-    sd._init_colors()
-    rows = sd._draw_frame(stdscr)
-    try:
-        _draw_menu(stdscr, rows + 1)
-    except curses.error:
-        pass
-    stdscr.refresh()
+    renderer_for(stdscr).generation_frame(maze_gen, theme_index)
 
 
 def animate_generation(
-    maze_gen: 'MazeGenerator', algo: str = "dfs", delay: int = 20
+    maze_gen: 'MazeGenerator',
+    algo: str = "dfs",
+    delay: int = 20,
+    duration: Optional[float] = None,
 ) -> None:
     # Launch a curses session that animates the selected generator.
     curses.wrapper(lambda stdscr: _run_generation(
-        stdscr, maze_gen, algo, delay))
+        stdscr, maze_gen, algo, delay, duration))
+
+
+def _schedule(
+    maze_gen: 'MazeGenerator', delay: int, duration: Optional[float] = None
+) -> None:
+    # Pace the coming animated generation: delay ms per step for small
+    # mazes, never more than MAX_ANIMATION_SECONDS (or duration) in total.
+    steps = maze_gen.animation_steps()
+    if duration is None:
+        duration = animation_duration(steps, delay)
+    maze_gen.scheduler = AnimationScheduler(steps, duration)
+
+
+def _start_generation(
+    maze_gen: 'MazeGenerator',
+    delay: int,
+    duration: Optional[float] = None,
+    solve: bool = True,
+) -> BackgroundTask[list[tuple[int, int]]]:
+    # Generate (and solve) maze_gen on a worker thread. The worker never
+    # touches curses: it only paces its steps and reports dirty cells,
+    # and the UI thread draws the frames in _watch_generation.
+    _schedule(maze_gen, delay, duration)
+
+    def work(cancel_event: threading.Event) -> list[tuple[int, int]]:
+        maze_gen.cancel_event = cancel_event
+        maze_gen.generate(animate=True)
+        if not solve:
+            return []
+        return maze_gen.solve(
+            maze_gen.config['ENTRY'], maze_gen.config['EXIT'])
+
+    return BackgroundTask(work)
+
+
+def _watch_generation(
+    stdscr: curses.window,
+    task: BackgroundTask[list[tuple[int, int]]],
+    maze_gen: 'MazeGenerator',
+    theme_index: int,
+    can_cancel: bool = False,
+) -> int:
+    # Draw frames of a background generation until it ends, polling keys
+    # between frames: '3' rotates colors, c/Esc cancel (when allowed) and
+    # any other key skips the rest of the animation. Returns the theme.
+    renderer = renderer_for(stdscr)
+    stdscr.timeout(FRAME_MS)
+    try:
+        while not task.done():
+            renderer.generation_frame(maze_gen, theme_index)
+            key = stdscr.getch()
+            if key == ord('3'):
+                theme_index += 1
+            elif can_cancel and key in CANCEL_KEYS:
+                task.cancel()
+            elif key != -1:
+                maze_gen.scheduler = None
+        task.wait()
+    finally:
+        stdscr.timeout(-1)
+    if task.error is not None and not task.cancelled:
+        raise task.error
+    if not task.cancelled:
+        renderer.generation_frame(maze_gen, theme_index)
+    return theme_index
 
 
 def _run_generation(
-    stdscr: curses.window, maze_gen: Any, algo: str, delay: int
+    stdscr: curses.window,
+    maze_gen: Any,
+    algo: str,
+    delay: int,
+    duration: Optional[float] = None,
 ) -> None:
     # Run the chosen algorithm, then keep the generated maze visible.
-    curses.curs_set(0)
+    renderer_for(stdscr)
+    if algo not in ("dfs", "prim", "eller"):
+        raise ValueError("algo must be 'dfs', 'prim' or 'eller'")
 
-    if algo == "dfs":
-        maze_gen.dfs_algo(stdscr=stdscr, animate=True, delay=delay)
-    elif algo == "prim":
-        maze_gen.prim_algo(stdscr=stdscr, animate=True, delay=delay)
-    else:
-        raise ValueError("algo must be 'dfs' or 'prim'")
-
-    draw_generation_frame(stdscr, maze_gen)
+    task = _start_generation(maze_gen, delay, duration, solve=False)
+    _watch_generation(stdscr, task, maze_gen, 0)
 
     stdscr.refresh()
     stdscr.getch()
@@ -265,109 +742,151 @@ def _run_generation(
 def simple_menu_maze(
     maze_gen: 'MazeGenerator',
     path: list[tuple[int, int]],
-    algo: str = "dfs",
     gen_delay: int = 15,
 ) -> None:
-    # Start the interactive maze viewer with its control menu.
+    # Start the interactive maze viewer with its control menu. Regeneration
+    # uses the algorithm of maze_gen's own class.
     curses.wrapper(lambda stdscr: _simple_menu_loop(
-        stdscr, maze_gen, path, algo, gen_delay))
+        stdscr, maze_gen, path, gen_delay))
+
+
+def _reveal_path(
+    stdscr: curses.window,
+    maze_gen: 'MazeGenerator',
+    full_path: list[tuple[int, int]],
+    theme_index: int,
+) -> SimpleDisplay:
+    # Animate the solved path one cell at a time: draw the maze once, then
+    # repaint only the display cells each appended path cell changes.
+    # Returns the display, which caches the built matrix for later deltas.
+    # A key press skips to the full path.
+    sd = SimpleDisplay(maze_gen, [])
+    sd.theme_index = theme_index
+    sd._init_colors(stdscr)
+    _redraw(stdscr, sd)
+    stdscr.timeout(50)
+    try:
+        for cell in full_path:
+            sd._paint(stdscr, sd.add_path_cell(cell))
+
+            stdscr.noutrefresh()
+            curses.doupdate()
+            if stdscr.getch() != -1:
+                sd._paint(stdscr, sd.set_path(full_path))
+                stdscr.refresh()
+                break
+    finally:
+        stdscr.timeout(-1)
+    return sd
+
+
+def _redraw(stdscr: curses.window, sd: SimpleDisplay) -> None:
+    # Paint the whole maze and the menu under it.
+    rows = sd._draw_frame(stdscr)
+    try:
+        _draw_menu(stdscr, rows + 1)
+    except curses.error:
+        pass
+    stdscr.refresh()
+
+
+def _fresh_maze(maze_gen: 'MazeGenerator') -> 'MazeGenerator':
+    # New, not yet generated maze with the same config (and 42 pattern).
+    new_gen = type(maze_gen)(maze_gen.config)
+    if hasattr(maze_gen, 'reserved'):
+        try:
+            new_gen.set_42()
+        except Exception:
+            pass
+    return new_gen
 
 
 def _simple_menu_loop(
     stdscr: curses.window,
     maze_gen: 'MazeGenerator',
     path: list[tuple[int, int]],
-    algo: str,
     gen_delay: int,
 ) -> None:
     # Process menu inputs for regeneration, path toggle, theme changes,
     # and exit.
-    curses.curs_set(0)
+    renderer_for(stdscr)
 
     full_path = path
     show_path = True
     theme_index = 0
 
-    # path animation first time
-    shown_path = []
-    for cell in full_path:
-        shown_path.append(cell)
+    # Mazes for option 1 are generated and solved ahead of time
+    template = maze_gen
+    pool = MazePool(lambda: _fresh_maze(template))
 
-        sd = SimpleDisplay(maze_gen, shown_path)
-        sd.theme_index = theme_index
-        sd._init_colors()
-        rows = sd._draw_frame(stdscr)
-
-        try:
-            _draw_menu(stdscr, rows + 1)
-        except curses.error:
-            pass
-
-        stdscr.refresh()
-        curses.napms(50)
+    # path animation first time
+    sd = _reveal_path(stdscr, maze_gen, full_path, theme_index)
 
+    # The display of the current maze is kept between keys: path toggles
+    # and theme changes patch it instead of rebuilding it
     while True:
-        sd = SimpleDisplay(maze_gen, full_path if show_path else [])
-        sd.theme_index = theme_index
-        sd._init_colors()
-        rows = sd._draw_frame(stdscr)
-
-        try:
-            _draw_menu(stdscr, rows + 1)
-        except curses.error:
-            pass
-
-        stdscr.refresh()
         key = stdscr.getch()
 
         if key == ord('1'):
-            new_gen = type(maze_gen)(maze_gen.config)
-
-            if hasattr(maze_gen, 'reserved'):
-                try:
-                    new_gen.set_42()
-                except Exception:
-                    pass
-
-            # generate with animation
-            if algo == "prim" and hasattr(new_gen, "prim_algo"):
-                new_gen.prim_algo(stdscr=stdscr, animate=True,
-                                  delay=gen_delay, theme_index=theme_index)
-            elif algo == "dfs" and hasattr(new_gen, "dfs_algo"):
-                new_gen.dfs_algo(stdscr=stdscr, animate=True,
-                                 delay=gen_delay, theme_index=theme_index)
-            else:
-                raise ValueError("Invalid algorithm choice.")
+            ready = pool.get()
+            if ready is not None:
+                # A pooled maze is already solved: only reveal its path
+                maze_gen, full_path = ready
+                show_path = True
+                sd = _reveal_path(stdscr, maze_gen, full_path, theme_index)
+                continue
+
+            # Pool empty: generate and solve in the background, animated
+            new_gen = _fresh_maze(maze_gen)
+            task = _start_generation(new_gen, gen_delay)
+            theme_index = _watch_generation(
+                stdscr, task, new_gen, theme_index, can_cancel=True)
+            if task.cancelled:
+                # Keep showing the previous maze
+                sd.theme_index = theme_index
+                sd._init_colors(stdscr)
+                _redraw(stdscr, sd)
+                continue
 
-            full_path = new_gen.solve_bfs(
-                new_gen.config['ENTRY'], new_gen.config['EXIT'])
+            full_path = task.result or []
             maze_gen = new_gen
             show_path = True
 
             # Same behavior as first run: animate solved path
             # after regeneration.
-            shown_path = []
-            for cell in full_path:
-                shown_path.append(cell)
-
-                sd = SimpleDisplay(maze_gen, shown_path)
-                sd.theme_index = theme_index
-                sd._init_colors()
-                rows = sd._draw_frame(stdscr)
-
-                try:
-                    _draw_menu(stdscr, rows + 1)
-                except curses.error:
-                    pass
-
-                stdscr.refresh()
-                curses.napms(50)
+            sd = _reveal_path(stdscr, maze_gen, full_path, theme_index)
 
         elif key == ord('2'):
             show_path = not show_path
+            sd._paint(stdscr, sd.set_path(full_path if show_path else []))
+            stdscr.refresh()
 
         elif key == ord('3'):
+            # Redefining the color pairs recolors cells already on screen
             theme_index += 1
+            sd.theme_index = theme_index
+            sd._init_colors(stdscr)
+            stdscr.refresh()
 
         elif key == ord('4'):
+            pool.close()
             break
+
+        elif key in SCROLL_KEYS:
+            rows, cols = SCROLL_KEYS[key]
+            view_h, view_w = sd._view_size(stdscr)
+            sd.scroll(stdscr, rows * max(1, view_h // 4),
+                      cols * max(1, view_w // 4))
+            _redraw(stdscr, sd)
+
+        elif key in (ord('+'), ord('=')):
+            sd.set_zoom(stdscr, sd.zoom - 1)
+            _redraw(stdscr, sd)
+
+        elif key == ord('-'):
+            sd.set_zoom(stdscr, sd.zoom + 1)
+            _redraw(stdscr, sd)
+
+        else:
+            # Any other key (e.g. a terminal resize) repaints everything
+            _redraw(stdscr, sd)
@@ -0,0 +1,102 @@
+from array import array
+from collections import deque
+from typing import TYPE_CHECKING, Optional
+
+from mazegenerator.maze_grid import id_typecode
+from mazegenerator.solvers import DIRECTION_D, OPEN_COUNT, START
+
+if TYPE_CHECKING:
+    from mazegenerator import MazeGenerator
+
+
+class DistanceField:
+    """Breadth-first distances and parents from one source cell."""
+
+    def __init__(self, maze: 'MazeGenerator', source: tuple[int, int]) -> None:
+        # Run one full BFS from source, storing a distance per cell in a typed
+        # array and the arrival direction per cell in a bytearray.
+        width = maze.width
+        height = maze.height
+        count = width * height
+        cells = maze.grid.cells
+        self.width = width
+        self.height = height
+        self.source = source
+        typecode = id_typecode(count)
+        self.unreached = (1 << (8 * array(typecode).itemsize)) - 1
+        self.dist = array(typecode, [self.unreached]) * count
+        self.came_from = bytearray(count)
+
+        start = source[1] * width + source[0]
+        self.dist[start] = 0
+        self.came_from[start] = START
+        queue = deque([start])
+        reached = 0
+        open_sides = 0
+        while queue:
+            curr = queue.popleft()
+            reached += 1
+            walls = cells[curr]
+            open_sides += OPEN_COUNT[walls]
+            step = self.dist[curr] + 1
+            y, x = divmod(curr, width)
+            for direction, (dx, dy) in DIRECTION_D.items():
+                if walls & direction:
+                    continue
+                if not (0 <= x + dx < width and 0 <= y + dy < height):
+                    continue
+                nxt = curr + dy * width + dx
+                if not self.came_from[nxt]:
+                    self.came_from[nxt] = direction
+                    self.dist[nxt] = step
+                    queue.append(nxt)
+        self.reached = reached
+        # Each passage is seen from both ends; a tree has reached - 1 of them
+        self.is_tree = open_sides == 2 * (reached - 1)
+
+    def distance(self, cell: tuple[int, int]) -> Optional[int]:
+        # Return the number of steps from the source, or None if unreachable.
+        value = self.dist[cell[1] * self.width + cell[0]]
+        return None if value == self.unreached else value
+
+    def path_to(self, target: tuple[int, int]) -> list[tuple[int, int]]:
+        # Shortest path from the source to target in O(path length).
+        cell = target[1] * self.width + target[0]
+        if self.dist[cell] == self.unreached:
+            return []
+        path = [cell]
+        while self.came_from[cell] != START:
+            cell = self._parent(cell)
+            path.append(cell)
+        return [(c % self.width, c // self.width) for c in reversed(path)]
+
+    def path_between(
+        self, start: tuple[int, int], exit: tuple[int, int]
+    ) -> list[tuple[int, int]]:
+        # Path between any two reachable cells through their lowest common
+        # ancestor. Only valid when the reachable maze is a tree (perfect).
+        if not self.is_tree:
+            raise ValueError("path_between needs a perfect maze.")
+        a = start[1] * self.width + start[0]
+        b = exit[1] * self.width + exit[0]
+        if self.dist[a] == self.unreached or self.dist[b] == self.unreached:
+            return []
+
+        # Lift the deeper cell, then both together, until they meet
+        up_a = [a]
+        up_b = [b]
+        while self.dist[up_a[-1]] > self.dist[up_b[-1]]:
+            up_a.append(self._parent(up_a[-1]))
+        while self.dist[up_b[-1]] > self.dist[up_a[-1]]:
+            up_b.append(self._parent(up_b[-1]))
+        while up_a[-1] != up_b[-1]:
+            up_a.append(self._parent(up_a[-1]))
+            up_b.append(self._parent(up_b[-1]))
+
+        ids = up_a + up_b[-2::-1]
+        return [(cell % self.width, cell // self.width) for cell in ids]
+
+    def _parent(self, cell: int) -> int:
+        # Step one cell back toward the source.
+        dx, dy = DIRECTION_D[self.came_from[cell]]
+        return cell - (dy * self.width + dx)
@@ -0,0 +1,331 @@
+import curses
+from itertools import compress
+from operator import and_, mul
+from typing import Iterator, Optional
+
+from mazegenerator import MazeGenerator
+from mazegenerator.maze_animation import animate_step
+from mazegenerator.maze_io import HEX_ENCODE
+
+NORTH = 1
+EAST = 2
+SOUTH = 4
+WEST = 8
+
+# '0'/'1' digits of a mask <-> one 0/1 byte per cell
+BITS = bytes.maketrans(b'01', b'\x00\x01')
+DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+
+# Opened walls of a cell -> its wall bits
+CLOSE = bytes(15 - v if v < 16 else 0 for v in range(256))
+
+
+class EllerGenerator(MazeGenerator):
+    """Maze generator that carves one row at a time
+    using Eller's algorithm."""
+
+    def generate(
+        self,
+        stdscr: Optional[curses.window] = None,
+        animate: bool = False,
+        delay: int = 20,
+        theme_index: int = 0,
+    ) -> None:
+        self.eller_algo(stdscr, animate, delay, theme_index)
+
+    def eller_algo(
+        self,
+        stdscr: Optional[curses.window] = None,
+        animate: bool = False,
+        delay: int = 20,
+        theme_index: int = 0,
+    ) -> None:
+        # Copy every finished row into the grid as one slice assignment.
+        width = self.width
+        cells = self.grid.cells
+
+        if animate:
+            animate_step(stdscr, self, delay, theme_index)
+
+        imperfect = self._imperfect()
+        for y, row in self._eller_rows():
+            cells[y * width:(y + 1) * width] = row
+            if animate:
+                self._touch(*range(y * width, (y + 1) * width))
+                animate_step(stdscr, self, delay, theme_index)
+        self.revision += 1
+
+        # Loops are opened on the finished grid, like for DFS and Prim
+        if imperfect:
+            self.add_loops()
+            if animate:
+                animate_step(stdscr, self, delay, theme_index)
+
+    def animation_steps(self) -> int:
+        # One frame for the empty grid, one per finished row, and one for
+        # the loops of an imperfect maze.
+        return self.height + 1 + (self.config.get('PERFECT') is False)
+
+    def iter_rows(self) -> Iterator[bytes]:
+        # Lazily generate the maze and yield each finished row of wall bits.
+        # Only the current row is kept in memory; the grid is never touched.
+        # Loops (PERFECT=False, LOOP_RATIO, BRAID) need the full grid, so
+        # only perfect mazes can be streamed.
+        if self._imperfect():
+            raise ValueError(
+                'Only perfect mazes can be streamed; PERFECT=False needs '
+                'the full grid.')
+        for _, row in self._eller_rows():
+            yield bytes(row)
+
+    def stream_to_file(self, filename: str) -> None:
+        # Generate and write the maze row by row, keeping memory O(width).
+        # Without the full grid there is nothing to solve, so the path
+        # section is left empty.
+        with open(filename, "wb") as f:
+            for row in self.iter_rows():
+                f.write(row.translate(HEX_ENCODE) + b"\n")
+            self._write_footer(f, [])
+
+    def _eller_rows(self) -> Iterator[tuple[int, bytearray]]:
+        # Yield (y, wall bits) for each row once it can no longer change.
+        # Bit x of an int mask stands for cell x of the row: the joins and
+        # carries of a whole row are drawn with one getrandbits(width) each.
+        width = self.width
+        height = self.height
+        full = (1 << width) - 1
+        reserved_rows = self._reserved_rows()
+        row_comps = self._row_components(reserved_rows)
+        blocked = {
+            y: sum(1 << x for x in xs) for y, xs in reserved_rows.items()}
+        rng = self.rng
+        getrandbits = rng.getrandbits
+        positions = range(width)
+
+        # Set label of each cell in the current row (0 = reserved/unset)
+        labels = [0] * width
+        # Cells of the current row whose north wall was opened from above
+        carried = 0
+        free = full & ~blocked.get(0, 0)
+
+        for y in range(height):
+            last = y == height - 1
+            free_cells = _cells(free, width)
+
+            # Every free cell not entered from above gets its own set; the
+            # labels are unique over the whole maze
+            base = y * width + 1
+            labels = [
+                label or fresh
+                for label, fresh in zip(labels, range(base, base + width))]
+            if free != full:
+                labels = list(map(mul, labels, free_cells))
+
+            # Randomly join neighbors (the last row joins every pair); a
+            # join between two cells of one set is dropped again
+            joins = free & (free >> 1)
+            if not last:
+                joins &= getrandbits(width)
+            parent: dict[int, int] = {}
+            for x in compress(positions, _cells(joins, width)):
+                a = labels[x]
+                b = labels[x + 1]
+                while a in parent:
+                    a = parent[a]
+                while b in parent:
+                    b = parent[b]
+                if a == b:
+                    joins ^= 1 << x
+                else:
+                    parent[b] = a
+            if parent:
+                roots = {}
+                for label in parent:
+                    root = label
+                    while root in parent:
+                        root = parent[root]
+                    roots[label] = root
+                labels = list(map(roots.get, labels, labels))
+
+            if last:
+                yield y, _row(carried, joins, 0, width)
+                break
+
+            # Carry random cells down, then one more cell of every set the
+            # draw left without a carry
+            below = full & ~blocked.get(y + 1, 0)
+            eligible = free & below
+            north = carried
+            carried = getrandbits(width) & eligible
+            eligible_cells = _cells(eligible, width)
+            missing = (
+                set(compress(labels, eligible_cells))
+                - set(compress(labels, _cells(carried, width))))
+            if missing:
+                candidates: dict[int, list[int]] = {}
+                for x in compress(positions, map(
+                        and_, eligible_cells,
+                        map(missing.__contains__, labels))):
+                    candidates.setdefault(labels[x], []).append(x)
+                for xs in candidates.values():
+                    carried |= 1 << xs[rng.randrange(len(xs))]
+            row = _row(north, joins, carried, width)
+
+            # Reserved cells below split the rest of the maze into separate
+            # regions; add links until every region is tied to this row
+            below_comps = row_comps.get(y + 1)
+            if below_comps is not None:
+                members: dict[int, list[int]] = {}
+                for x in compress(positions, free_cells):
+                    members.setdefault(labels[x], []).append(x)
+                carried_cells = bytearray(_cells(carried, width))
+                self._link_regions(
+                    row, labels, members, carried_cells, below_comps)
+                carried = int(carried_cells.translate(DIGITS)[::-1], 2)
+
+            labels = list(map(mul, labels, _cells(carried, width)))
+            free = below
+            yield y, row
+
+    def _link_regions(
+        self,
+        row: bytearray,
+        labels: list[int],
+        members: dict[int, list[int]],
+        carried: bytearray,
+        below_comps: list[int],
+    ) -> None:
+        # Kruskal pass over the links of this row: sets are keyed by their
+        # label, regions below by their negated component id.
+        parent: dict[int, int] = {}
+
+        def find(key: int) -> int:
+            root = key
+            while parent.get(root, root) != root:
+                root = parent[root]
+            while key != root:
+                parent[key], key = root, parent[key]
+            return root
+
+        def union(a: int, b: int) -> None:
+            parent[find(a)] = find(b)
+
+        width = len(row)
+        for x in range(width):
+            if carried[x]:
+                union(labels[x], -below_comps[x])
+
+        links = []
+        for x in range(width):
+            if labels[x] and x + 1 < width and labels[x + 1]:
+                links.append((x, EAST))
+            if labels[x] and below_comps[x] and not carried[x]:
+                links.append((x, SOUTH))
+        self.rng.shuffle(links)
+
+        for x, direction in links:
+            if direction == EAST:
+                a, b = labels[x], labels[x + 1]
+                if find(a) != find(b):
+                    self._join(row, labels, members, x)
+                    union(a, b)
+            elif find(labels[x]) != find(-below_comps[x]):
+                row[x] &= ~SOUTH
+                carried[x] = 1
+                union(labels[x], -below_comps[x])
+
+    def _join(
+        self,
+        row: bytearray,
+        labels: list[int],
+        members: dict[int, list[int]],
+        x: int,
+    ) -> None:
+        # Open the wall east of x and merge the two sets it separated.
+        row[x] &= ~EAST
+        row[x + 1] &= ~WEST
+        keep, drop = labels[x], labels[x + 1]
+        if len(members[keep]) < len(members[drop]):
+            keep, drop = drop, keep
+        for cx in members[drop]:
+            labels[cx] = keep
+        members[keep].extend(members.pop(drop))
+
+    def _reserved_rows(self) -> dict[int, set[int]]:
+        # Group reserved ("42") cells by row: y -> set of x.
+        rows: dict[int, set[int]] = {}
+        reserved: set[tuple[int, int]] = getattr(self, 'reserved', set())
+        for x, y in reserved:
+            rows.setdefault(y, set()).add(x)
+        return rows
+
+    def _row_components(
+        self, reserved_rows: dict[int, set[int]]
+    ) -> dict[int, list[int]]:
+        # Bottom-up, label each free cell of a row with the connected region
+        # of free cells it belongs to, looking only at that row and below.
+        # Rows without reserved cells are one region and are left out.
+        width = self.width
+        comps: dict[int, list[int]] = {}
+        for y in range(self.height - 1, -1, -1):
+            blocked = reserved_rows.get(y)
+            if not blocked:
+                continue
+            below = comps.get(y + 1)
+            below_blocked = reserved_rows.get(y + 1, set())
+            has_below = y + 1 < self.height
+
+            # Runs of this row are merged when they reach the same region
+            parent: dict[int, int] = {}
+
+            def find(key: int) -> int:
+                while parent.get(key, key) != key:
+                    key = parent[key]
+                return key
+
+            runs = list(_runs(blocked, width))
+            for start, end in runs:
+                for x in range(start, end):
+                    if not has_below or x in below_blocked:
+                        continue
+                    region = -(below[x] if below is not None else 1)
+                    a, b = find(start + 1), find(region)
+                    if a != b:
+                        parent[a] = b
+
+            row = [0] * width
+            ids: dict[int, int] = {}
+            for start, end in runs:
+                region_id = ids.setdefault(find(start + 1), len(ids) + 1)
+                row[start:end] = [region_id] * (end - start)
+            comps[y] = row
+        return comps
+
+
+def _cells(mask: int, width: int) -> bytes:
+    # One 0/1 byte per cell x, from bit x of mask.
+    return format(mask, f'0{width}b')[::-1].encode().translate(BITS)
+
+
+def _row(north: int, east: int, south: int, width: int) -> bytearray:
+    # Wall bits of a row from the masks of its opened north, east and south
+    # walls; a cell's west wall is open when its west neighbor's east is.
+    opened = (
+        int.from_bytes(_cells(north, width), 'little')
+        + 2 * int.from_bytes(_cells(east, width), 'little')
+        + 4 * int.from_bytes(_cells(south, width), 'little')
+        + 8 * int.from_bytes(_cells(east << 1, width), 'little'))
+    return bytearray(opened.to_bytes(width, 'little')).translate(CLOSE)
+
+
+def _runs(blocked: set[int], width: int) -> Iterator[tuple[int, int]]:
+    # Yield [start, end) for each run of consecutive x not in blocked.
+    x = 0
+    while x < width:
+        if x in blocked:
+            x += 1
+            continue
+        start = x
+        while x < width and x not in blocked:
+            x += 1
+        yield start, x
@@ -0,0 +1,148 @@
+import os
+import struct
+import zlib
+from itertools import groupby
+from typing import TYPE_CHECKING, BinaryIO, Callable, TextIO
+
+from mazegenerator.display_maze import (
+    ENTRY_T, EXIT_T, PASSAGE, PATH, RESERVED, WALL, SimpleDisplay)
+
+if TYPE_CHECKING:
+    from mazegenerator import MazeGenerator
+
+# RGB color of each display cell type in image exports
+COLORS = {
+    WALL: (0x20, 0x20, 0x20),
+    PASSAGE: (0xFF, 0xFF, 0xFF),
+    RESERVED: (0x99, 0x33, 0xCC),
+    ENTRY_T: (0x22, 0xAA, 0x22),
+    EXIT_T: (0xDD, 0x22, 0x22),
+    PATH: (0xEE, 0xCC, 0x22),
+}
+
+# ANSI background color code of each display cell type (curses theme 0)
+ANSI_BACKGROUNDS = {
+    WALL: 47,
+    PASSAGE: 49,
+    RESERVED: 45,
+    ENTRY_T: 42,
+    EXIT_T: 41,
+    PATH: 43,
+}
+
+# Display rows built per block while streaming an export
+ROW_BLOCK = 256
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def write_svg(
+    f: TextIO,
+    maze_gen: 'MazeGenerator',
+    path: list[tuple[int, int]],
+    scale: int = 10,
+) -> None:
+    # One display cell is one unit of the viewBox: a passage-colored
+    # background, then one rect per horizontal run of any other type,
+    # streamed a block of rows at a time.
+    sd = SimpleDisplay(maze_gen, path)
+    cols = 2 * maze_gen.width + 1
+    rows = 2 * maze_gen.height + 1
+    f.write(
+        '<svg xmlns="http://www.w3.org/2000/svg" '
+        f'width="{cols * scale}" height="{rows * scale}" '
+        f'viewBox="0 0 {cols} {rows}" shape-rendering="crispEdges">\n'
+        f'<rect width="{cols}" height="{rows}" '
+        f'fill="{_hex(COLORS[PASSAGE])}"/>\n')
+    for dy, row in enumerate(sd.iter_display_rows(ROW_BLOCK)):
+        dx = 0
+        parts = []
+        for kind, run in groupby(row):
+            width = len(list(run))
+            if kind != PASSAGE:
+                parts.append(
+                    f'<rect x="{dx}" y="{dy}" width="{width}" height="1" '
+                    f'fill="{_hex(COLORS.get(kind, COLORS[WALL]))}"/>\n')
+            dx += width
+        f.write("".join(parts))
+    f.write("</svg>\n")
+
+
+def write_png(
+    f: BinaryIO,
+    maze_gen: 'MazeGenerator',
+    path: list[tuple[int, int]],
+    scale: int = 4,
+) -> None:
+    # Palette PNG, one byte per pixel holding the display cell type. The
+    # container (chunks, CRCs, scanline filters) is written by hand; the
+    # image data goes through an incremental zlib stream, so only one
+    # block of display rows is held in memory at a time.
+    sd = SimpleDisplay(maze_gen, path)
+    cols = 2 * maze_gen.width + 1
+    rows = 2 * maze_gen.height + 1
+    f.write(PNG_SIGNATURE)
+    _png_chunk(f, b"IHDR", struct.pack(
+        ">IIBBBBB", cols * scale, rows * scale, 8, 3, 0, 0, 0))
+    _png_chunk(f, b"PLTE", b"".join(
+        bytes(COLORS.get(kind, COLORS[WALL])) for kind in range(PATH + 1)))
+
+    compressor = zlib.compressobj()
+    line = bytearray(1 + cols * scale)  # filter byte 0, then pixels
+    for row in sd.iter_display_rows(ROW_BLOCK):
+        # Widen each cell to scale pixels, then repeat the scanline
+        for i in range(scale):
+            line[1 + i::scale] = row
+        data = compressor.compress(bytes(line) * scale)
+        if data:
+            _png_chunk(f, b"IDAT", data)
+    _png_chunk(f, b"IDAT", compressor.flush())
+    _png_chunk(f, b"IEND", b"")
+
+
+def write_ansi(
+    f: TextIO,
+    maze_gen: 'MazeGenerator',
+    path: list[tuple[int, int]],
+) -> None:
+    # Colored text dump, two spaces per display cell, one line per row.
+    sd = SimpleDisplay(maze_gen, path)
+    for row in sd.iter_display_rows(ROW_BLOCK):
+        f.write("".join(
+            f"\x1b[{ANSI_BACKGROUNDS.get(kind, 49)}m" + "  " * len(list(run))
+            for kind, run in groupby(row)
+        ) + "\x1b[0m\n")
+
+
+def _png_chunk(f: BinaryIO, kind: bytes, data: bytes) -> None:
+    # Length, type, data and CRC of the type and data.
+    f.write(struct.pack(">I", len(data)) + kind + data)
+    f.write(struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+
+def _hex(color: tuple[int, int, int]) -> str:
+    return "#%02x%02x%02x" % color
+
+
+def export(
+    maze_gen: 'MazeGenerator',
+    path: list[tuple[int, int]],
+    filename: str,
+) -> None:
+    # Pick the exporter from the file extension (.svg, .png or .ans).
+    ext = os.path.splitext(filename)[1].lower()
+    if ext not in EXPORTERS:
+        raise ValueError(
+            f"Unsupported image format '{ext}', use one of "
+            f"{', '.join(EXPORTERS)}.")
+    mode, writer = EXPORTERS[ext]
+    with open(filename, mode) as f:
+        writer(f, maze_gen, path)
+
+
+# File mode and writer for each supported image extension
+EXPORTERS: dict[str, tuple[str, Callable[..., None]]] = {
+    ".svg": ("w", write_svg),
+    ".png": ("wb", write_png),
+    ".ans": ("w", write_ansi),
+}
@@ -1,6 +1,7 @@
 import curses
 from typing import TYPE_CHECKING, Optional
 
+from mazegenerator.background import GenerationCancelled
 from mazegenerator.display_maze import draw_generation_frame
 
 if TYPE_CHECKING:
@@ -14,6 +15,20 @@ def animate_step(
     theme_index: int = 0,
 ) -> None:
     # Redraw the maze state for one animation step, then pause briefly.
-    if stdscr is not None:
+    # With a scheduler attached, steps are batched and a frame is drawn
+    # only when one is due; the scheduler paces the frames. Without a
+    # screen (generation on a background thread) the steps are only paced
+    # and the UI thread draws the frames from maze_gen.dirty.
+    if maze_gen.cancel_event is not None and maze_gen.cancel_event.is_set():
+        raise GenerationCancelled()
+    scheduler = maze_gen.scheduler
+    if stdscr is None:
+        if scheduler is not None and scheduler.due():
+            scheduler.frame_drawn()
+        return
+    if scheduler is None:
         draw_generation_frame(stdscr, maze_gen, theme_index)
         curses.napms(delay)
+    elif scheduler.due():
+        draw_generation_frame(stdscr, maze_gen, theme_index)
+        scheduler.frame_drawn()
@@ -0,0 +1,64 @@
+from typing import Iterator
+
+# Wall value of a fresh cell: all four wall bits set
+FULL = 15
+
+
+def id_typecode(count: int) -> str:
+    # Pick the smallest array typecode able to hold ids below count.
+    return 'I' if count <= 0xFFFFFFFF else 'Q'
+
+
+class MazeGrid:
+    """Compact maze storage: one byte of wall bits per cell, row-major."""
+
+    def __init__(self, width: int, height: int, fill: int = FULL) -> None:
+        # Allocate a single contiguous buffer indexed by y * width + x.
+        self.width = width
+        self.height = height
+        self.cells = bytearray([fill]) * (width * height)
+
+    def index(self, x: int, y: int) -> int:
+        # Convert (x, y) coordinates into a linear cell id.
+        return y * self.width + x
+
+    def coords(self, cell_id: int) -> tuple[int, int]:
+        # Convert a linear cell id back into (x, y) coordinates.
+        y, x = divmod(cell_id, self.width)
+        return (x, y)
+
+    def get(self, x: int, y: int) -> int:
+        # Return the wall bits of the cell at (x, y).
+        return self.cells[y * self.width + x]
+
+    def set(self, x: int, y: int, value: int) -> None:
+        # Overwrite the wall bits of the cell at (x, y).
+        self.cells[y * self.width + x] = value
+
+    def row(self, y: int) -> memoryview:
+        # Return a writable zero-copy view over one row of the buffer.
+        if y < 0:
+            y += self.height
+        if not 0 <= y < self.height:
+            raise IndexError(
+                f"Row {y} is out of bounds for {self.height} rows.")
+        start = y * self.width
+        return memoryview(self.cells)[start:start + self.width]
+
+    def __getitem__(self, y: int) -> memoryview:
+        # Compatibility view so that grid[y][x] keeps working.
+        return self.row(y)
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __iter__(self) -> Iterator[memoryview]:
+        for y in range(self.height):
+            yield self.row(y)
+
+    def to_lists(self) -> list[list[int]]:
+        # Copy the grid out as the historical list-of-lists layout.
+        return [list(self.row(y)) for y in range(self.height)]
+
+    def __repr__(self) -> str:
+        return repr(self.to_lists())
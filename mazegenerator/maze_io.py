@@ -0,0 +1,294 @@
+import mmap
+import struct
+from typing import Any, BinaryIO, Union
+
+from mazegenerator.maze_grid import MazeGrid
+
+# bytes.translate table mapping a cell's wall bits (0-15) to its hex digit
+HEX_ENCODE = b"0123456789ABCDEF" * 16
+
+# Inverse table: hex digit (either case) -> wall bits, anything else -> 0xFF
+HEX_DECODE = bytes(
+    int(chr(c), 16) if chr(c) in "0123456789ABCDEFabcdef" else 0xFF
+    for c in range(256)
+)
+
+# Direction letter for each (dx, dy) step of a solution path
+STEP_LETTERS = {(1, 0): "E", (-1, 0): "W", (0, 1): "S", (0, -1): "N"}
+
+# (dx, dy) step for each direction letter of a solution path
+LETTER_STEPS = {ord(v): k for k, v in STEP_LETTERS.items()}
+
+# Binary format: header, rows packed two cells per byte (first cell in the
+# high nibble, odd widths padded), then the path packed 2 bits per step
+BINARY_MAGIC = b"AMZB"
+BINARY_VERSION = 1
+# magic, version, flags, width, height, entry x/y, exit x/y, seed, algo,
+# number of path steps
+BINARY_HEADER = struct.Struct("<4sHHIIIIIIq8sQ")
+# Header flag set when the seed field holds a real seed
+FLAG_SEED = 1
+# Range of the signed 64-bit seed field
+SEED_MIN = -2 ** 63
+SEED_MAX = 2 ** 63 - 1
+
+# translate tables used to pack and unpack nibbles and 2-bit path codes
+HIGH_NIBBLE = bytes((v << 4) & 0xFF for v in range(256))
+NIBBLE_HIGH = bytes(v >> 4 for v in range(256))
+NIBBLE_LOW = bytes(v & 15 for v in range(256))
+LETTER_CODES = bytes(max("NESW".find(chr(c)), 0) for c in range(256))
+CODE_LETTERS = b"NESW" * 64
+# Bit shift of each of the four path steps stored in one byte
+STEP_SHIFTS = (6, 4, 2, 0)
+PACK_STEP = [bytes((v << s) & 0xFF for v in range(256)) for s in STEP_SHIFTS]
+UNPACK_STEP = [bytes((v >> s) & 3 for v in range(256)) for s in STEP_SHIFTS]
+
+# Rows are encoded in blocks of about this many bytes per write call
+CHUNK_BYTES = 1 << 22
+
+
+def write_hex_rows(
+    f: BinaryIO, cells: Union[bytes, bytearray], width: int
+) -> None:
+    # Encode the grid with one translate call per block of rows and write
+    # each block at once; small mazes go out in a single write.
+    rows_per_block = max(1, CHUNK_BYTES // (width + 1))
+    step = rows_per_block * width
+    for start in range(0, len(cells), step):
+        block = cells[start:start + step].translate(HEX_ENCODE)
+        f.write(b"\n".join(
+            block[i:i + width] for i in range(0, len(block), width)
+        ) + b"\n")
+
+
+def path_to_directions(path: list[tuple[int, int]]) -> str:
+    # Convert a list of cells into N/E/S/W letters, one per step.
+    return "".join(
+        STEP_LETTERS[(nx - cx, ny - cy)]
+        for (cx, cy), (nx, ny) in zip(path, path[1:])
+    )
+
+
+def footer_bytes(
+    entry: tuple[int, int],
+    exit: tuple[int, int],
+    path: list[tuple[int, int]],
+) -> bytes:
+    # Build the sections that follow the grid: a blank separator line,
+    # entry and exit coordinates, then the path as direction letters.
+    return (
+        f"\n{entry[0]},{entry[1]}\n{exit[0]},{exit[1]}\n"
+        f"{path_to_directions(path)}\n"
+    ).encode()
+
+
+def read_maze_file(filename: str) -> tuple[
+    MazeGrid, tuple[int, int], tuple[int, int], list[tuple[int, int]]
+]:
+    # Parse a maze written by write_to_file: returns the grid, entry, exit
+    # and solution path. The file is memory-mapped and decoded straight into
+    # the compact grid a block of rows at a time, so it is never held as one
+    # Python string.
+    with open(filename, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise ValueError(f"Maze file '{filename}' is empty.")
+    with mm:
+        width = mm.find(b"\n")
+        grid_end = mm.find(b"\n\n") + 1
+        if width <= 0 or grid_end <= 0 or grid_end % (width + 1):
+            raise ValueError(f"Maze file '{filename}' has a malformed grid.")
+        height = grid_end // (width + 1)
+        grid = MazeGrid(width, height)
+
+        rows_per_block = max(1, CHUNK_BYTES // (width + 1))
+        for y in range(0, height, rows_per_block):
+            rows = min(rows_per_block, height - y)
+            start = y * (width + 1)
+            block = mm[start:start + rows * (width + 1)]
+            cells = block.translate(HEX_DECODE, b"\n")
+            if (
+                block[width::width + 1] != b"\n" * rows
+                or len(cells) != rows * width
+                or 0xFF in cells
+            ):
+                raise ValueError(
+                    f"Maze file '{filename}' has a malformed row "
+                    f"near line {y + 1}.")
+            grid.cells[y * width:(y + rows) * width] = cells
+
+        lines = mm[grid_end + 1:].split(b"\n")
+
+    if len(lines) < 3:
+        raise ValueError(f"Maze file '{filename}' is missing ENTRY/EXIT.")
+    entry = _parse_point(lines[0], width, height)
+    exit = _parse_point(lines[1], width, height)
+
+    # Replay the direction letters from the entry to rebuild the path
+    x, y = entry
+    path = [entry]
+    for letter in lines[2].strip():
+        if letter not in LETTER_STEPS:
+            raise ValueError(
+                f"Maze file '{filename}' has an invalid path letter "
+                f"'{chr(letter)}'.")
+        dx, dy = LETTER_STEPS[letter]
+        x, y = x + dx, y + dy
+        path.append((x, y))
+    return grid, entry, exit, path if len(path) > 1 else []
+
+
+def _parse_point(line: bytes, width: int, height: int) -> tuple[int, int]:
+    # Parse an "x,y" line and check it lies inside the grid.
+    try:
+        x, y = (int(part) for part in line.split(b","))
+    except ValueError:
+        raise ValueError(f"Invalid coordinate line {line!r} in maze file.")
+    if not (0 <= x < width and 0 <= y < height):
+        raise ValueError(f"Coordinate {x},{y} is outside the maze.")
+    return (x, y)
+
+
+def write_binary(
+    f: BinaryIO,
+    grid: MazeGrid,
+    config: dict[str, Any],
+    path: list[tuple[int, int]],
+) -> None:
+    # Write the compact binary format: a fixed header, the grid packed two
+    # cells per byte and the path packed four steps per byte.
+    width, height = grid.width, grid.height
+    entry, exit = config['ENTRY'], config['EXIT']
+    seed = config.get('SEED')
+    # The header keeps the seed in a signed 64-bit field
+    if seed is not None and not SEED_MIN <= seed <= SEED_MAX:
+        raise ValueError(
+            f"SEED {seed} does not fit the binary format "
+            f"({SEED_MIN} to {SEED_MAX}).")
+    algo = str(config.get('ALGO') or '').encode()[:8]
+    steps = path_to_directions(path).encode()
+    f.write(BINARY_HEADER.pack(
+        BINARY_MAGIC, BINARY_VERSION, FLAG_SEED if seed is not None else 0,
+        width, height, entry[0], entry[1], exit[0], exit[1],
+        seed if seed is not None else 0, algo, len(steps),
+    ))
+
+    rows_per_block = max(1, CHUNK_BYTES // width)
+    for y in range(0, height, rows_per_block):
+        block = grid.cells[y * width:(y + rows_per_block) * width]
+        if width % 2:
+            # Pad every row with a zero cell so each row starts on a byte
+            block = bytearray(b"\0".join(
+                block[i:i + width] for i in range(0, len(block), width)
+            ) + b"\0")
+        f.write(_or_bytes(block[0::2].translate(HIGH_NIBBLE), block[1::2]))
+
+    codes = steps.translate(LETTER_CODES) + bytes(-len(steps) % 4)
+    f.write(_or_bytes(*(
+        codes[i::4].translate(PACK_STEP[i]) for i in range(4))))
+
+
+def read_binary(filename: str) -> tuple[
+    MazeGrid, dict[str, Any], list[tuple[int, int]]
+]:
+    # Load a file written by write_binary: returns the grid, a config-style
+    # dict of the header fields and the solution path.
+    with _map_file(filename) as mm:
+        header = _read_header(mm, filename)
+        width, height = header['WIDTH'], header['HEIGHT']
+        row_bytes = (width + 1) // 2
+        grid = MazeGrid(width, height)
+
+        rows_per_block = max(1, CHUNK_BYTES // row_bytes)
+        offset = BINARY_HEADER.size
+        for y in range(0, height, rows_per_block):
+            rows = min(rows_per_block, height - y)
+            packed = mm[offset:offset + rows * row_bytes]
+            offset += rows * row_bytes
+            cells = bytearray(2 * len(packed))
+            cells[0::2] = packed.translate(NIBBLE_HIGH)
+            cells[1::2] = packed.translate(NIBBLE_LOW)
+            if width % 2 == 0:
+                grid.cells[y * width:(y + rows) * width] = cells
+                continue
+            for r in range(rows):
+                start = r * (width + 1)
+                grid.cells[(y + r) * width:(y + r + 1) * width] = (
+                    cells[start:start + width])
+
+        steps = header.pop('STEPS')
+        packed = mm[offset:offset + (steps + 3) // 4]
+    if len(packed) * 4 < steps:
+        raise ValueError(f"Maze file '{filename}' is truncated.")
+
+    codes = bytearray(4 * len(packed))
+    for i in range(4):
+        codes[i::4] = packed.translate(UNPACK_STEP[i])
+    x, y = header['ENTRY']
+    path = [(x, y)]
+    for letter in codes[:steps].translate(CODE_LETTERS):
+        dx, dy = LETTER_STEPS[letter]
+        x, y = x + dx, y + dy
+        path.append((x, y))
+    return grid, header, path if steps else []
+
+
+def read_binary_row(filename: str, y: int) -> bytes:
+    # Random access: unpack a single row of wall bits without reading the
+    # rest of the grid.
+    with _map_file(filename) as mm:
+        header = _read_header(mm, filename)
+        width = header['WIDTH']
+        if not 0 <= y < header['HEIGHT']:
+            raise IndexError(f"Row {y} is out of bounds.")
+        row_bytes = (width + 1) // 2
+        start = BINARY_HEADER.size + y * row_bytes
+        packed = mm[start:start + row_bytes]
+    cells = bytearray(2 * row_bytes)
+    cells[0::2] = packed.translate(NIBBLE_HIGH)
+    cells[1::2] = packed.translate(NIBBLE_LOW)
+    return bytes(cells[:width])
+
+
+def _map_file(filename: str) -> mmap.mmap:
+    # Read-only mapping of a binary maze file; mmap cannot map an empty one.
+    with open(filename, "rb") as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise ValueError(f"Maze file '{filename}' is empty.")
+
+
+def _read_header(mm: mmap.mmap, filename: str) -> dict[str, Any]:
+    # Unpack and check the fixed-size header straight from the mapping.
+    if len(mm) < BINARY_HEADER.size:
+        raise ValueError(f"Maze file '{filename}' is truncated.")
+    (magic, version, flags, width, height, entry_x, entry_y, exit_x,
+     exit_y, seed, algo, steps) = BINARY_HEADER.unpack_from(memoryview(mm))
+    if magic != BINARY_MAGIC or version != BINARY_VERSION:
+        raise ValueError(f"'{filename}' is not a binary maze file.")
+    if width == 0 or height == 0:
+        raise ValueError(f"Maze file '{filename}' has an empty grid.")
+    for x, y in ((entry_x, entry_y), (exit_x, exit_y)):
+        if not (x < width and y < height):
+            raise ValueError(f"Coordinate {x},{y} is outside the maze.")
+    if len(mm) < BINARY_HEADER.size + height * ((width + 1) // 2):
+        raise ValueError(f"Maze file '{filename}' is truncated.")
+    return {
+        'WIDTH': width, 'HEIGHT': height,
+        'ENTRY': (entry_x, entry_y), 'EXIT': (exit_x, exit_y),
+        'SEED': seed if flags & FLAG_SEED else None,
+        'ALGO': algo.rstrip(b"\0").decode() or None,
+        'STEPS': steps,
+    }
+
+
+def _or_bytes(*parts: Union[bytes, bytearray]) -> bytes:
+    # Bitwise OR of equally long byte strings, done on big integers.
+    # Missing trailing bytes count as zero (odd-length slices).
+    size = len(parts[0])
+    acc = 0
+    for part in parts:
+        acc |= int.from_bytes(part, "little")
+    return acc.to_bytes(size, "little")
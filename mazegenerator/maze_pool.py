@@ -0,0 +1,68 @@
+import queue
+import threading
+from typing import TYPE_CHECKING, Callable, Optional
+
+if TYPE_CHECKING:
+    from mazegenerator import MazeGenerator
+
+# Number of ready mazes kept by default
+POOL_SIZE = 2
+
+# A generated maze together with its solved path
+Ready = tuple['MazeGenerator', list[tuple[int, int]]]
+
+
+class MazePool:
+    """Bounded pool of generated and solved mazes, kept full by a daemon
+    producer thread so a new maze is available without waiting."""
+
+    def __init__(
+        self,
+        factory: Callable[[], 'MazeGenerator'],
+        size: int = POOL_SIZE,
+    ) -> None:
+        # factory returns a fresh, not yet generated maze for the config.
+        self.factory = factory
+        self.error: Optional[BaseException] = None
+        self._queue: 'queue.Queue[Ready]' = queue.Queue(maxsize=size)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+
+    def _produce(self) -> None:
+        # Generate and solve mazes, blocking while the pool is full.
+        try:
+            while not self._stop.is_set():
+                gen = self.factory()
+                gen.generate()
+                path = gen.solve(gen.config['ENTRY'], gen.config['EXIT'])
+                while not self._stop.is_set():
+                    try:
+                        self._queue.put((gen, path), timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+        except BaseException as e:
+            # Keep the error; callers fall back to generating on demand
+            self.error = e
+
+    def get(self) -> Optional[Ready]:
+        # Pop a ready maze without waiting, or None if none is ready yet.
+        try:
+            return self._queue.get_nowait()
+        except queue.Empty:
+            return None
+
+    def __len__(self) -> int:
+        return self._queue.qsize()
+
+    def close(self) -> None:
+        # Stop the producer; a maze being generated is finished first.
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+
+    def __enter__(self) -> 'MazePool':
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
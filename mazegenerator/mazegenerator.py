@@ -1,8 +1,16 @@
 import curses
-import random
+import threading
+from array import array
 from collections import deque
-from typing import Any, Optional
+from typing import Any, BinaryIO, Optional, Union
+from mazegenerator.distance_field import DistanceField
 from mazegenerator.maze_animation import animate_step
+from mazegenerator.maze_grid import MazeGrid, id_typecode
+from mazegenerator.rng import make_rng
+from mazegenerator.scheduler import AnimationScheduler
+from mazegenerator.solvers import SOLVERS, START
+from mazegenerator.maze_io import (
+    footer_bytes, read_binary, read_maze_file, write_binary, write_hex_rows)
 
 # constants representing the four wall directions of a cell
 NORTH = 1
@@ -27,8 +35,22 @@ DIRECTION_D = {
 }
 
 
+# Number of walls set for every 4-bit cell value
+WALL_COUNT = bytes(bin(value).count('1') for value in range(16))
+
+# 1 for every 4-bit cell value with exactly 3 walls (a dead end), else 0
+DEAD_END = bytes(int(count == 3) for count in WALL_COUNT) + bytes(240)
+# 1 for every cell value with its east / south wall up, else 0
+EAST_WALL = bytes(int(bool(value & EAST)) for value in range(256))
+SOUTH_WALL = bytes(int(bool(value & SOUTH)) for value in range(256))
+# 1 where a reserved_mask() byte marks a free cell, else 0
+FREE_CELL = b"\1" + bytes(255)
+
+
 # Main class that handles maze creation, solving, and file output
 class MazeGenerator:
+    # Extra walls opened per cell when PERFECT=False and LOOP_RATIO is unset
+    loop_ratio = 0.1
 
     # Initializes the maze grid and configuration from parsed config dict
     def __init__(self, parsed_dict: dict[str, Any]) -> None:
@@ -45,18 +67,82 @@ class MazeGenerator:
         ):
             raise ValueError('height must be a positive integer!')
         self.config = parsed_dict
-        # Set the random seed if provided for reproducible mazes
-        if self.config.get('SEED') is not None:
-            random.seed(self.config['SEED'])
+        # Own RNG seeded from SEED (OS entropy when None), so a seed gives
+        # the same maze whatever other generators or threads are running
+        self.rng = make_rng(self.config.get('SEED'))
         self.width = parsed_dict['WIDTH']
         self.height = parsed_dict['HEIGHT']
-        # Initialize grid with all walls up (15 = all 4 bits set)
-        self.grid = []
-        for _ in range(self.height):
-            temp = []
-            for _ in range(self.width):
-                temp.append(15)
-            self.grid.append(temp)
+        # The grid (all walls up, 15 = all 4 bits set) is allocated on first
+        # use, so streaming generators never pay for width * height bytes
+        self._grid: Optional[MazeGrid] = None
+        # Bumped whenever walls change; cached distance fields from an older
+        # revision are dropped on the next query
+        self.revision = 0
+        self._fields: dict[tuple[int, int], DistanceField] = {}
+        self._fields_revision = 0
+        # Ids of cells whose walls changed since the last animation frame;
+        # None while no incremental renderer is listening
+        self.dirty: Optional[list[int]] = None
+        # Paces animate_step when set; None keeps one frame per step
+        self.scheduler: Optional[AnimationScheduler] = None
+        # Set from another thread to stop an animated generation
+        self.cancel_event: Optional[threading.Event] = None
+        # Extra walls the last make_imperfect call could not open
+        self.missing_loops = 0
+
+    # Loads a maze written by write_to_file; returns it with its stored path
+    @classmethod
+    def from_file(
+        cls, filename: str
+    ) -> tuple['MazeGenerator', list[tuple[int, int]]]:
+        grid, entry, exit, path = read_maze_file(filename)
+        gen = cls({
+            'WIDTH': grid.width, 'HEIGHT': grid.height,
+            'ENTRY': entry, 'EXIT': exit,
+            'OUTPUT_FILE': filename, 'PERFECT': None, 'SEED': None,
+        })
+        gen.grid = grid
+        gen.reserved = gen._walled_cells()
+        return gen, path
+
+    # Loads a maze saved by write_binary; returns it with its stored path
+    @classmethod
+    def from_binary(
+        cls, filename: str
+    ) -> tuple['MazeGenerator', list[tuple[int, int]]]:
+        grid, header, path = read_binary(filename)
+        gen = cls({
+            'WIDTH': grid.width, 'HEIGHT': grid.height,
+            'ENTRY': header['ENTRY'], 'EXIT': header['EXIT'],
+            'OUTPUT_FILE': filename, 'PERFECT': None,
+            'SEED': header['SEED'], 'ALGO': header['ALGO'],
+        })
+        gen.grid = grid
+        gen.reserved = gen._walled_cells()
+        return gen, path
+
+    # Returns cells with all four walls up: the reserved ("42") cells of a
+    # loaded maze
+    def _walled_cells(self) -> set[tuple[int, int]]:
+        cells = self.grid.cells
+        walled = set()
+        cell = cells.find(15)
+        while cell != -1:
+            walled.add(self.grid.coords(cell))
+            cell = cells.find(15, cell + 1)
+        return walled
+
+    # Returns the maze grid, allocating it on first access
+    @property
+    def grid(self) -> MazeGrid:
+        if self._grid is None:
+            self._grid = MazeGrid(self.width, self.height)
+        return self._grid
+
+    @grid.setter
+    def grid(self, grid: MazeGrid) -> None:
+        self._grid = grid
+        self.revision += 1
 
     # Returns the wall value of a cell at (x, y)
     def get_cell(self, x: int, y: int) -> int:
@@ -67,7 +153,7 @@ class MazeGenerator:
                     f"{self.width}x{self.height} grid."
                 )
             )
-        return self.grid[y][x]
+        return self.grid.cells[y * self.width + x]
 
     # Checks if a specific wall exists on a cell at (x, y)
     def has_wall(self, x: int, y: int, wall_bit: int) -> bool:
@@ -77,7 +163,7 @@ class MazeGenerator:
         if not (0 <= x < self.width and 0 <= y < self.height):
             return False
 
-        return (self.grid[y][x] & wall_bit) != 0
+        return (self.grid.cells[y * self.width + x] & wall_bit) != 0
 
     # Removes a wall between cell (x, y) and its neighbor in a dirc
     def remove_wall(self, x: int, y: int, direction: int) -> None:
@@ -93,15 +179,41 @@ class MazeGenerator:
         if not (0 <= x < self.width and 0 <= y < self.height):
             return
 
+        cells = self.grid.cells
+
         # Remove the wall on the current cell side
-        self.grid[y][x] = self.grid[y][x] & ~direction
+        cells[y * self.width + x] &= ~direction
 
         # Remove the wall on the neighbor cell side
         dx, dy = DIRECTION_D[direction]
         nx = x + dx
         ny = y + dy
+        self._touch(y * self.width + x)
         if 0 <= nx < self.width and 0 <= ny < self.height:
-            self.grid[ny][nx] = self.grid[ny][nx] & ~OPPOSITE[direction]
+            cells[ny * self.width + nx] &= ~OPPOSITE[direction]
+            self._touch(ny * self.width + nx)
+        self.revision += 1
+
+    # Reports changed cells to the incremental renderer, if one listens
+    def _touch(self, *cell_ids: int) -> None:
+        if self.dirty is not None:
+            self.dirty.extend(cell_ids)
+
+    # Runs this generator's algorithm; subclasses override it
+    def generate(
+        self,
+        stdscr: Optional[curses.window] = None,
+        animate: bool = False,
+        delay: int = 20,
+        theme_index: int = 0,
+    ) -> None:
+        self.dfs_algo(stdscr, animate, delay, theme_index)
+
+    # Number of animate_step calls an animated generate() makes: one for
+    # the start state, one per carved cell and one for the extra loops
+    def animation_steps(self) -> int:
+        free = self.width * self.height - len(getattr(self, 'reserved', ()))
+        return max(1, free) + (self.config.get('PERFECT') is False)
 
     # Prints the raw grid array for debugging
     def print_grid(self) -> None:
@@ -141,180 +253,429 @@ class MazeGenerator:
         delay: int = 20,
         theme_index: int = 0,
     ) -> None:
-        visited: set[tuple[int, int]] = set()
-        stack: list[tuple[int, int]] = []
-
-        # Mark reserved cells ("42" pattern) as already visited
-        reserved: set[tuple[int, int]] = getattr(self, 'reserved', set())
-        visited.update(reserved)
+        imperfect = self._imperfect()
+        width = self.width
+        height = self.height
+        cells = self.grid.cells
+        # One byte per cell instead of a set of tuples keeps memory bounded;
+        # reserved cells ("42" pattern) start out as already visited
+        visited = self.reserved_mask()
 
         # Find a valid starting cell that is not reserved
-        start = (0, 0)
-        if start in reserved:
-            found = False
-            for y in range(self.height):
-                for x in range(self.width):
-                    if (x, y) not in reserved:
-                        start = (x, y)
-                        found = True
-                        break
-                if found:
-                    break
+        start = visited.find(0)
+        if start == -1:
+            return
 
-        visited.add(start)
-        stack.append(start)
+        visited[start] = 1
+        # The stack holds linear cell ids packed in a typed array
+        stack = array(id_typecode(width * height), [start])
+        # Random bytes drawn in bulk; one picks among the open directions
+        rand = self.rng.byte_stream()
+        pick = self.rng.pick
         # Animate the initial state if animation is enabled
         if animate:
             animate_step(stdscr, self, delay, theme_index)
 
         # Main DFS loop: explore neighbors and passages
         while stack:
-            curr_x, curr_y = stack[-1]
-            neighbors = self.get_neighbors(curr_x, curr_y)
+            curr = stack[-1]
+            curr_y, curr_x = divmod(curr, width)
 
-            # Filter to only unvisited and non-reserved neighbors
+            # Collect unvisited and non-reserved neighbors (N, S, E, W)
             unvisited = []
-            for neighbor in neighbors:
-                nx, ny, direction = neighbor
-                if (nx, ny) not in visited and (nx, ny) not in reserved:
-                    unvisited.append(neighbor)
+            if curr_y > 0 and not visited[curr - width]:
+                unvisited.append(NORTH)
+            if curr_y + 1 < height and not visited[curr + width]:
+                unvisited.append(SOUTH)
+            if curr_x + 1 < width and not visited[curr + 1]:
+                unvisited.append(EAST)
+            if curr_x > 0 and not visited[curr - 1]:
+                unvisited.append(WEST)
 
             if unvisited:
                 # Pick a random unvisited neighbor and create a passage
-                nx, ny, direction = random.choice(unvisited)
-                self.remove_wall(curr_x, curr_y, direction)
-                visited.add((nx, ny))
-                stack.append((nx, ny))
+                direction = unvisited[pick(rand, len(unvisited))]
+                dx, dy = DIRECTION_D[direction]
+                nxt = curr + dy * width + dx
+                cells[curr] &= ~direction
+                cells[nxt] &= ~OPPOSITE[direction]
+                visited[nxt] = 1
+                stack.append(nxt)
                 # Animate each carving step
                 if animate:
+                    self._touch(curr, nxt)
                     animate_step(stdscr, self, delay, theme_index)
             else:
                 # Backtrack if no unvisited neighbors remain
                 stack.pop()
+        self.revision += 1
         # If maze is not perfect, remove extra walls to create loops
-        if self.config['PERFECT'] is False:
-            tot = int((self.height * self.width) * 0.1)
-            self.make_imperfect(tot)
+        if imperfect:
+            self.add_loops()
             # Animate the imperfect maze result
             if animate:
                 animate_step(stdscr, self, delay, theme_index)
 
+    # Tells whether the maze gets loops (PERFECT=False); BRAID and
+    # LOOP_RATIO are rejected for any other PERFECT value
+    def _imperfect(self) -> bool:
+        imperfect = self.config.get('PERFECT') is False
+        if not imperfect and (
+            self.config.get('BRAID')
+            or self.config.get('LOOP_RATIO') is not None
+        ):
+            raise ValueError('BRAID and LOOP_RATIO require PERFECT=False.')
+        return imperfect
+
+    # Opens the extra walls of an imperfect maze: every dead end with BRAID,
+    # else LOOP_RATIO (default: the algorithm's loop_ratio) times the cells
+    def add_loops(self) -> None:
+        self._imperfect()
+        if self.config.get('BRAID'):
+            self.braid()
+            return
+        ratio = self.config.get('LOOP_RATIO')
+        if ratio is None:
+            ratio = self.loop_ratio
+        self.make_imperfect(int(self.height * self.width * ratio))
+
+    # Removes every dead end (braid maze) by opening one wall of each
+    def braid(self) -> None:
+        # Dead ends are indexed once and visited in random order; one that
+        # an earlier removal already fixed is skipped. A wall to another
+        # dead end is preferred, since opening it fixes both. Dead ends
+        # whose every wall faces the border, a reserved cell or a 3x3 area
+        # are left.
+        width = self.width
+        height = self.height
+        cells = self.grid.cells
+        reserved = self.reserved_mask()
+        rng = self.rng
+        dead = cells.translate(DEAD_END)
+        ends = array(id_typecode(width * height))
+        i = dead.find(1)
+        while i != -1:
+            ends.append(i)
+            i = dead.find(1, i + 1)
+        rng.shuffle(ends)
+
+        for curr in ends:
+            if WALL_COUNT[cells[curr]] != 3:
+                continue
+            y, x = divmod(curr, width)
+            pairs = []
+            others = []
+            for direction, (dx, dy) in DIRECTION_D.items():
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                nxt = ny * width + nx
+                if reserved[nxt] or not cells[curr] & direction:
+                    continue
+                # _opens_area takes the wall from its west/north cell
+                if direction in (EAST, SOUTH):
+                    opens = self._opens_area(curr, direction)
+                else:
+                    opens = self._opens_area(nxt, OPPOSITE[direction])
+                if opens:
+                    continue
+                if WALL_COUNT[cells[nxt]] == 3:
+                    pairs.append((direction, nxt))
+                else:
+                    others.append((direction, nxt))
+            choices = pairs or others
+            if choices:
+                direction, nxt = choices[rng.randrange(len(choices))]
+                self._open_wall(curr, nxt, direction)
+        self.revision += 1
+
     # Removes extra walls to create multiple paths (imperfect maze)
     def make_imperfect(self, extra_walls: int) -> None:
+        # Candidate walls are indexed and sampled directly, in tiers:
+        # walls between two dead ends first (the only kind removed before),
+        # then walls of a dead end, then any closed interior wall. Each
+        # tier is indexed once the previous one runs out. Candidates are
+        # re-checked when drawn, since earlier removals can invalidate
+        # them; a removal that would open a 3x3 area is skipped. Walls that
+        # could not be opened are left in missing_loops.
+        width = self.width
+        cells = self.grid.cells
+        reserved = self.reserved_mask()
+        rng = self.rng
         walls_removed = 0
-        max_attempts = extra_walls * 100
 
-        attempts = 0
-        reserved: set[tuple[int, int]] = getattr(self, 'reserved', set())
-
-        # Try to remove walls randomly until target is reached or max attempts
-        while walls_removed < extra_walls and attempts < max_attempts:
-            x = random.randint(0, self.width - 1)
-            y = random.randint(0, self.height - 1)
-
-            direction = random.choice([NORTH, SOUTH, EAST, WEST])
-            dx, dy = DIRECTION_D[direction]
-            nx, ny = x + dx, y + dy
-
-            # Skip if neighbor is out of bounds
-            if not (0 <= nx < self.width and 0 <= ny < self.height):
-                attempts += 1
-                continue
-            # Skip if either cell is reserved
-            if (x, y) in reserved or (nx, ny) in reserved:
-                attempts += 1
-                continue
-
-            # Only remove wall if both cells have exactly 3 walls
-            if self.has_wall(x, y, direction) and self.has_wall(
-                nx, ny, OPPOSITE[direction]
+        for tier in (2, 1, 0):
+            if walls_removed >= extra_walls:
+                break
+            if tier:
+                walls = self._dead_end_walls(reserved, tier)
+            else:
+                walls = self._closed_walls(reserved)
+            while walls_removed < extra_walls and walls:
+                idx = rng.randrange(len(walls))
+                walls[idx], walls[-1] = walls[-1], walls[idx]
+                curr, direction = divmod(walls.pop(), 2)
+                direction = SOUTH if direction else EAST
+                nxt = curr + (width if direction == SOUTH else 1)
+                if not cells[curr] & direction:
+                    continue
+                dead_ends = (WALL_COUNT[cells[curr]] == 3) + (
+                    WALL_COUNT[cells[nxt]] == 3)
+                if dead_ends < tier or self._opens_area(curr, direction):
+                    continue
+                self._open_wall(curr, nxt, direction)
+                walls_removed += 1
+        self.missing_loops = extra_walls - walls_removed
+        self.revision += 1
+
+    # Lists the closed walls between two free cells, like _dead_end_walls
+    def _closed_walls(self, reserved: bytearray) -> 'array[int]':
+        # One 0/1 byte per cell for each condition, combined with big-int
+        # ANDs; only the matches are visited in Python.
+        width = self.width
+        height = self.height
+        cells = self.grid.cells
+        size = width * height
+        free = reserved.translate(FREE_CELL)
+        east = (
+            int.from_bytes(cells.translate(EAST_WALL), 'big')
+            & int.from_bytes(free, 'big')
+            & int.from_bytes(free[1:] + b"\0", 'big')
+            & int.from_bytes(
+                (b"\1" * (width - 1) + b"\0") * height, 'big')
+        ).to_bytes(size, 'big')
+        south = (
+            int.from_bytes(cells.translate(SOUTH_WALL), 'big')
+            & int.from_bytes(free, 'big')
+            & int.from_bytes(free[width:] + bytes(width), 'big')
+        ).to_bytes(size, 'big')
+        walls = array(id_typecode(size * 2))
+        for bit, mask in ((0, east), (1, south)):
+            i = mask.find(1)
+            while i != -1:
+                walls.append(i * 2 + bit)
+                i = mask.find(1, i + 1)
+        return walls
+
+    # Lists the walls of dead ends as cell_id * 2 + (0 east, 1 south)
+    def _dead_end_walls(
+        self, reserved: bytearray, min_dead_ends: int = 1
+    ) -> 'array[int]':
+        # Keeps walls between two free cells with at least min_dead_ends
+        # dead ends (exactly 3 walls) among them.
+        width = self.width
+        height = self.height
+        cells = self.grid.cells
+        dead = cells.translate(DEAD_END)
+        walls = array(id_typecode(width * height * 2))
+        i = dead.find(1)
+        while i != -1:
+            y, x = divmod(i, width)
+            # (neighbor, wall owner, direction bit, owner's wall)
+            for nxt, owner, bit, ok in (
+                (i + 1, i, 0, x + 1 < width),
+                (i + width, i, 1, y + 1 < height),
+                (i - 1, i - 1, 0, x > 0),
+                (i - width, i - width, 1, y > 0),
             ):
-                if (
-                    self.count_walls(x, y) == 3
-                    and self.count_walls(nx, ny) == 3
-                ):
-                    self.remove_wall(x, y, direction)
-                    walls_removed += 1
-
-            attempts += 1
+                if not ok or reserved[nxt]:
+                    continue
+                if not cells[owner] & (SOUTH if bit else EAST):
+                    continue
+                if dead[i] + dead[nxt] < min_dead_ends:
+                    continue
+                # A wall between two dead ends is listed from the first one
+                if dead[nxt] and nxt < i:
+                    continue
+                walls.append(owner * 2 + bit)
+            i = dead.find(1, i + 1)
+        return walls
+
+    # Opens the wall between two adjacent cells, on direction's side of curr
+    def _open_wall(self, curr: int, nxt: int, direction: int) -> None:
+        cells = self.grid.cells
+        cells[curr] &= ~direction
+        cells[nxt] &= ~OPPOSITE[direction]
+        self._touch(curr, nxt)
+
+    # Tells whether opening a wall (EAST or SOUTH of curr) would leave a
+    # 3x3 block of cells with no wall inside it
+    def _opens_area(self, curr: int, direction: int) -> bool:
+        width = self.width
+        height = self.height
+        cells = self.grid.cells
+        y, x = divmod(curr, width)
+        # Every 3x3 window holding both cells of the wall
+        x_range = range(max(0, x - 1), min(x, width - 3) + 1)
+        y_range = range(max(0, y - 2), min(y, height - 3) + 1)
+        if direction == SOUTH:
+            x_range = range(max(0, x - 2), min(x, width - 3) + 1)
+            y_range = range(max(0, y - 1), min(y, height - 3) + 1)
+        for wy in y_range:
+            for wx in x_range:
+                open_area = True
+                for cy in range(wy, wy + 3):
+                    row = cy * width
+                    for cx in range(wx, wx + 3):
+                        cell = row + cx
+                        east = cx < wx + 2 and cells[cell] & EAST
+                        south = cy < wy + 2 and cells[cell] & SOUTH
+                        if east and not (cell == curr and direction == EAST):
+                            open_area = False
+                        if south and not (
+                                cell == curr and direction == SOUTH):
+                            open_area = False
+                    if not open_area:
+                        break
+                if open_area:
+                    return True
+        return False
 
-    # Reconstructs the path from BFS parent map, from exit back to start
+    # Reconstructs the path from the BFS arrival directions, exit to start
     def find_path(
-        self,
-        mapped: dict[
-            tuple[int, int], Optional[tuple[int, int]]
-        ],
-        exit: tuple[int, int],
+        self, came_from: bytearray, exit: tuple[int, int]
     ) -> list[tuple[int, int]]:
+        width = self.width
         path = []
-        curr: Optional[tuple[int, int]] = exit
-        # Walk backwards through parent pointers to build the path
-        while curr is not None:
-            path.append(curr)
-            curr = mapped[curr]
+        curr = exit[1] * width + exit[0]
+        # Walk backwards against the arrival directions to build the path
+        while True:
+            y, x = divmod(curr, width)
+            path.append((x, y))
+            direction = came_from[curr]
+            if direction == START:
+                break
+            dx, dy = DIRECTION_D[direction]
+            curr -= dy * width + dx
         return path[::-1]
 
     # Solves the maze using Breadth-First Search from start to exit
     def solve_bfs(
-        self, start: tuple[int, int], exit: tuple[int, int]
+        self,
+        start: tuple[int, int],
+        exit: tuple[int, int],
+        stats: Optional[dict[str, int]] = None,
     ) -> list[tuple[int, int]]:
-        queue = deque([start])
-        visited = {start}
-        mapped: dict[tuple[int, int],
-                     Optional[tuple[int, int]]] = {start: None}
+        width = self.width
+        height = self.height
+        if not (
+            0 <= start[0] < width and 0 <= start[1] < height
+            and 0 <= exit[0] < width and 0 <= exit[1] < height
+        ):
+            return []
+        cells = self.grid.cells
+        start_id = start[1] * width + start[0]
+        exit_id = exit[1] * width + exit[0]
+        # Direction each cell was entered with; 0 means not visited yet
+        came_from = bytearray(width * height)
+        came_from[start_id] = START
+        queue = deque([start_id])
+        expanded = 0
         # Explore cells level by level until exit is found
         while queue:
-            x, y = queue.popleft()
-            if (x, y) == exit:
-                return self.find_path(mapped, exit)
-            neighbors = self.get_neighbors(x, y)
-            # Add passable unvisited neighbors to the queue
-            for dx, dy, direc in neighbors:
-                if not self.has_wall(x, y, direc):
-                    if (dx, dy) not in visited:
-                        visited.add((dx, dy))
-                        mapped[(dx, dy)] = (x, y)
-                        queue.append((dx, dy))
+            curr = queue.popleft()
+            expanded += 1
+            if curr == exit_id:
+                if stats is not None:
+                    stats['expanded'] = expanded
+                return self.find_path(came_from, exit)
+            walls = cells[curr]
+            y, x = divmod(curr, width)
+            # Add passable unvisited neighbors to the queue (N, S, E, W)
+            if y > 0 and not walls & NORTH and not came_from[curr - width]:
+                came_from[curr - width] = NORTH
+                queue.append(curr - width)
+            if (
+                y + 1 < height and not walls & SOUTH
+                and not came_from[curr + width]
+            ):
+                came_from[curr + width] = SOUTH
+                queue.append(curr + width)
+            if x + 1 < width and not walls & EAST and not came_from[curr + 1]:
+                came_from[curr + 1] = EAST
+                queue.append(curr + 1)
+            if x > 0 and not walls & WEST and not came_from[curr - 1]:
+                came_from[curr - 1] = WEST
+                queue.append(curr - 1)
+        if stats is not None:
+            stats['expanded'] = expanded
         return []
 
-    # Writes the maze grid, entry/exit, and solution path to a file
+    # Returns the BFS distance field from source, computed once per source
+    # and reused until the walls change
+    def distance_field(self, source: tuple[int, int]) -> DistanceField:
+        if not (0 <= source[0] < self.width and 0 <= source[1] < self.height):
+            raise ValueError(f"Source {source} is outside the maze.")
+        if self._fields_revision != self.revision:
+            self._fields = {}
+            self._fields_revision = self.revision
+        field = self._fields.get(source)
+        if field is None:
+            field = DistanceField(self, source)
+            self._fields[source] = field
+        return field
+
+    # Shortest path between any two cells from cached distance fields.
+    # A perfect maze needs only the field from ENTRY: every pair is joined
+    # through its lowest common ancestor on that spanning tree.
+    def shortest_path(
+        self, start: tuple[int, int], exit: tuple[int, int]
+    ) -> list[tuple[int, int]]:
+        if not (
+            0 <= start[0] < self.width and 0 <= start[1] < self.height
+            and 0 <= exit[0] < self.width and 0 <= exit[1] < self.height
+        ):
+            return []
+        tree = self.distance_field(self.config['ENTRY'])
+        if tree.is_tree and tree.distance(start) is not None:
+            return tree.path_between(start, exit)
+        return self.distance_field(start).path_to(exit)
+
+    # Solves the maze with the solver named by the SOLVER config key
+    def solve(
+        self,
+        start: tuple[int, int],
+        exit: tuple[int, int],
+        stats: Optional[dict[str, int]] = None,
+    ) -> list[tuple[int, int]]:
+        solver = SOLVERS[self.config.get('SOLVER') or 'bfs']
+        return solver(self, start, exit, stats)
+
+    # Writes the maze grid, entry/exit, and solution path to a file name
+    # or to an already open binary file object
     def write_to_file(
-        self, filename: str, path: list[tuple[int, int]]
+        self,
+        filename: Union[str, BinaryIO],
+        path: list[tuple[int, int]],
+    ) -> None:
+        if not isinstance(filename, str):
+            self._write_maze(filename, path)
+            return
+        with open(filename, "wb") as f:
+            self._write_maze(f, path)
+
+    # Saves the maze in the compact binary format (4 bits per cell)
+    def write_binary(
+        self,
+        filename: Union[str, BinaryIO],
+        path: list[tuple[int, int]],
     ) -> None:
-        with open(filename, "w") as f:
-
-            # SECTION 1: Write each row of the grid as hex characters
-            for y in range(self.height):
-                row = ""
-                for x in range(self.width):
-                    row += format(self.grid[y][x], 'X')  # 'X' = uppercase hex
-                f.write(row + "\n")
-
-            # Empty line to separate sections
-            f.write("\n")
-
-            # SECTION 2: Write entry and exit coordinates
-            entry = self.config['ENTRY']
-            exit = self.config['EXIT']
-            f.write(f"{entry[0]},{entry[1]}\n")
-            f.write(f"{exit[0]},{exit[1]}\n")
-
-            # SECTION 3: Convert the path into direction letters (N/S/E/W)
-            directions = ""
-            for i in range(len(path) - 1):
-                cx, cy = path[i]      # current cell
-                nx, ny = path[i + 1]  # next cell
-                dx = nx - cx  # horizontal movement
-                dy = ny - cy  # vertical movement
-                if dx == 1:       # moved right
-                    directions += "E"
-                elif dx == -1:    # moved left
-                    directions += "W"
-                elif dy == 1:     # moved down
-                    directions += "S"
-                elif dy == -1:    # moved up
-                    directions += "N"
-            f.write(directions + "\n")
+        if not isinstance(filename, str):
+            write_binary(filename, self.grid, self.config, path)
+            return
+        with open(filename, "wb") as f:
+            write_binary(f, self.grid, self.config, path)
+
+    # Writes all three sections using bulk hex encoding of the grid
+    def _write_maze(self, f: BinaryIO, path: list[tuple[int, int]]) -> None:
+        # SECTION 1: each row of the grid as uppercase hex characters
+        write_hex_rows(f, self.grid.cells, self.width)
+        self._write_footer(f, path)
+
+    # Writes the entry/exit and solution path sections after the grid
+    def _write_footer(self, f: BinaryIO, path: list[tuple[int, int]]) -> None:
+        # SECTIONS 2 and 3: entry/exit coordinates, then N/E/S/W letters
+        f.write(footer_bytes(self.config['ENTRY'], self.config['EXIT'], path))
 
     # Embeds the "42" pattern into the maze grid as reserved cells
     def set_42(self) -> None:
@@ -347,12 +708,19 @@ class MazeGenerator:
                     gx = start_x + col
                     gy = start_y + row
                     self.reserved.add((gx, gy))
-                    self.grid[gy][gx] = 15
+                    # A grid allocated later already has all walls up
+                    if self._grid is not None:
+                        self._grid.set(gx, gy, 15)
+        self.revision += 1
+
+    # Returns one byte per cell, set to 1 for reserved ("42") cells
+    def reserved_mask(self) -> bytearray:
+        mask = bytearray(self.width * self.height)
+        reserved: set[tuple[int, int]] = getattr(self, 'reserved', set())
+        for x, y in reserved:
+            mask[y * self.width + x] = 1
+        return mask
 
     # Counts the number of walls present on a cell at (x, y)
     def count_walls(self, x: int, y: int) -> int:
-        count = 0
-        for direction in [NORTH, SOUTH, EAST, WEST]:
-            if self.has_wall(x, y, direction):
-                count += 1
-        return count
+        return WALL_COUNT[self.get_cell(x, y)]
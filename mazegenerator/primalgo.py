@@ -1,8 +1,9 @@
 import curses
-import random
+from array import array
 from typing import Optional
 
 from mazegenerator import MazeGenerator
+from mazegenerator.maze_grid import id_typecode
 from mazegenerator.maze_animation import animate_step
 
 NORTH = 1
@@ -17,11 +18,33 @@ DIRECTION_D = {
     WEST: (-1, 0),
 }
 
+OPPOSITE = {
+    NORTH: SOUTH,
+    SOUTH: NORTH,
+    EAST: WEST,
+    WEST: EAST,
+}
+
+# Frontier entries store an index into this tuple (same order as DIRECTION_D)
+DIRECTIONS = (NORTH, SOUTH, EAST, WEST)
+
 
 class PrimGenerator(MazeGenerator):
     """Maze generator that carves passages
     using randomized Prim's algorithm."""
 
+    # Extra walls opened per cell when PERFECT=False and LOOP_RATIO is unset
+    loop_ratio = 0.05
+
+    def generate(
+        self,
+        stdscr: Optional[curses.window] = None,
+        animate: bool = False,
+        delay: int = 20,
+        theme_index: int = 0,
+    ) -> None:
+        self.prim_algo(stdscr, animate, delay, theme_index)
+
     def prim_algo(
         self,
         stdscr: Optional[curses.window] = None,
@@ -30,66 +53,63 @@ class PrimGenerator(MazeGenerator):
         theme_index: int = 0,
     ) -> None:
         # Expand the maze from a start cell by opening random frontier walls.
-        in_maze = set()
-        reserved: set[tuple[int, int]] = getattr(self, "reserved", set())
-
-        start_x, start_y = 0, 0
-        if (start_x, start_y) in reserved:
-            found = False
-            for y in range(self.height):
-                for x in range(self.width):
-                    if (x, y) not in reserved:
-                        start_x, start_y = x, y
-                        found = True
-                        break
-                if found:
-                    break
-
-        in_maze.add((start_x, start_y))
+        imperfect = self._imperfect()
+        width = self.width
+        cells = self.grid.cells
+        # One byte per cell; reserved cells are pre-marked as in the maze
+        in_maze = self.reserved_mask()
+
+        start = in_maze.find(0)
+        if start == -1:
+            return
+        in_maze[start] = 1
 
         if animate:
             animate_step(stdscr, self, delay, theme_index)
 
-        frontier = self._get_frontier_walls(
-            start_x, start_y, in_maze, reserved)
+        # Frontier walls are packed as cell_id * 4 + direction index
+        frontier = array(id_typecode(width * self.height * 4))
+        self._get_frontier_walls(start, in_maze, frontier)
 
+        randrange = self.rng.randrange
         while frontier:
-            idx = random.randrange(len(frontier))  # random index
+            idx = randrange(len(frontier))  # random index
             frontier[idx], frontier[-1] = frontier[-1], frontier[idx]
-            from_x, from_y, to_x, to_y, direction = frontier.pop()
+            from_id, dir_index = divmod(frontier.pop(), 4)
+            direction = DIRECTIONS[dir_index]
+            dx, dy = DIRECTION_D[direction]
+            to_id = from_id + dy * width + dx
 
-            if (to_x, to_y) in in_maze or (to_x, to_y) in reserved:
+            if in_maze[to_id]:
                 continue
 
-            self.remove_wall(from_x, from_y, direction)
-            in_maze.add((to_x, to_y))
-            frontier.extend(self._get_frontier_walls(
-                to_x, to_y, in_maze, reserved))
+            cells[from_id] &= ~direction
+            cells[to_id] &= ~OPPOSITE[direction]
+            in_maze[to_id] = 1
+            self._get_frontier_walls(to_id, in_maze, frontier)
 
             if animate:
+                self._touch(from_id, to_id)
                 animate_step(stdscr, self, delay, theme_index)
+        self.revision += 1
 
-        if self.config.get("PERFECT") is False:
-            tot = int((self.height * self.width) * 0.05)
-            self.make_imperfect(tot)
+        if imperfect:
+            self.add_loops()
 
             if animate:
                 animate_step(stdscr, self, delay, theme_index)
 
     def _get_frontier_walls(
-        self, x: int, y: int,
-        in_maze: set[tuple[int, int]],
-        reserved: set[tuple[int, int]],
-    ) -> list[tuple[int, int, int, int, int]]:
-        # Return neighbor walls that can connect the current maze to new cells.
-        walls = []
-        for direction, (dx, dy) in DIRECTION_D.items():
+        self, cell_id: int, in_maze: bytearray, frontier: 'array[int]',
+    ) -> None:
+        # Push neighbor walls that can connect the current maze to new cells.
+        y, x = divmod(cell_id, self.width)
+        for dir_index, direction in enumerate(DIRECTIONS):
+            dx, dy = DIRECTION_D[direction]
             nx, ny = x + dx, y + dy
             if (
                 0 <= nx < self.width
                 and 0 <= ny < self.height
-                and (nx, ny) not in in_maze
-                and (nx, ny) not in reserved
+                and not in_maze[ny * self.width + nx]
             ):
-                walls.append((x, y, nx, ny, direction))
-        return walls
+                frontier.append(cell_id * 4 + dir_index)
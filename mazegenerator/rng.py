@@ -0,0 +1,34 @@
+import random
+from typing import Iterator, Optional
+
+# Bytes drawn from the Mersenne Twister per refill of a byte stream
+POOL_BYTES = 4096
+
+# BYTE_LIMIT[n]: largest multiple of n not above 256. A random byte below
+# it, taken modulo n, is a uniform choice among n options.
+BYTE_LIMIT = tuple(256 - 256 % n if n else 0 for n in range(257))
+
+
+class MazeRandom(random.Random):
+    """random.Random that can also hand out its randomness as a stream of
+    bytes drawn in bulk, for the small choices made by the carve loops.
+    Every generator owns one, so a seed gives the same maze whatever else
+    runs in the process or thread."""
+
+    def byte_stream(self) -> Iterator[int]:
+        # Endless random bytes, POOL_BYTES per randbytes() call.
+        while True:
+            yield from self.randbytes(POOL_BYTES)
+
+    def pick(self, stream: Iterator[int], n: int) -> int:
+        # Uniform integer in [0, n) (1 <= n <= 256) from stream bytes.
+        limit = BYTE_LIMIT[n]
+        value = next(stream)
+        while value >= limit:
+            value = next(stream)
+        return value % n
+
+
+# Generator RNG for a config: seeded from SEED, or from the OS when None
+def make_rng(seed: Optional[int] = None) -> MazeRandom:
+    return MazeRandom(seed)
@@ -0,0 +1,53 @@
+import math
+import time
+
+# Frames per second aimed for when a generation is animated
+DEFAULT_FPS = 30
+
+# Longest an animated generation may take, whatever the maze size
+MAX_ANIMATION_SECONDS = 10.0
+
+
+class AnimationScheduler:
+    """Groups generation steps into frames so an animation takes a fixed
+    wall-clock duration at a capped frame rate."""
+
+    def __init__(
+        self, total_steps: int, duration: float, fps: int = DEFAULT_FPS
+    ) -> None:
+        # Spread total_steps over duration seconds, at most fps frames/s.
+        self.total_steps = max(1, total_steps)
+        self.duration = max(0.0, duration)
+        self.fps = fps
+        self.start = time.monotonic()
+        self.done = 0
+        self.next_frame = 0
+        self._plan()
+
+    def due(self) -> bool:
+        # Count one generation step; True when it should end with a frame.
+        self.done += 1
+        return self.done >= self.next_frame
+
+    def frame_drawn(self) -> None:
+        # Sleep until the time slot of the progress reached so far, then
+        # size the next batch from the steps and time that are left.
+        progress = min(1.0, self.done / self.total_steps)
+        wait = self.start + self.duration * progress - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self._plan()
+
+    def _plan(self) -> None:
+        # Frames left in the remaining time decide the steps per frame, so
+        # slow frames make later batches larger instead of overrunning.
+        remaining_steps = self.total_steps - self.done
+        remaining_time = self.start + self.duration - time.monotonic()
+        frames = max(1, int(remaining_time * self.fps))
+        self.next_frame = self.done + max(
+            1, math.ceil(remaining_steps / frames))
+
+
+def animation_duration(steps: int, delay: int) -> float:
+    # Old per-step delay behavior for small mazes, capped for large ones.
+    return min(steps * delay / 1000, MAX_ANIMATION_SECONDS)
@@ -0,0 +1,235 @@
+import heapq
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Optional
+
+if TYPE_CHECKING:
+    from mazegenerator import MazeGenerator
+
+NORTH = 1
+EAST = 2
+SOUTH = 4
+WEST = 8
+
+# Maps each direction to its (dx, dy) movement offset
+DIRECTION_D = {
+    NORTH: (0, -1),
+    SOUTH: (0, 1),
+    EAST: (1, 0),
+    WEST: (-1, 0)
+}
+
+# Marks the start cell in an arrival-direction array
+START = 16
+
+# Turns a "filled" flag array into an arrival-direction array where filled
+# cells already count as visited
+FILLED_AS_VISITED = bytes([0]) + bytes([START + 1]) * 255
+
+# Number of open sides for every 4-bit cell value
+OPEN_COUNT = bytes(4 - bin(value & 15).count('1') for value in range(256))
+
+# Signature shared by every solver: (maze, start, exit, stats) -> path.
+# When given, stats['expanded'] receives the number of cells expanded.
+Solver = Callable[
+    ['MazeGenerator', tuple[int, int], tuple[int, int],
+     Optional[dict[str, int]]],
+    list[tuple[int, int]],
+]
+
+
+def _open_neighbors(
+    maze: 'MazeGenerator', curr: int
+) -> list[tuple[int, int]]:
+    # Return (cell id, direction) for each open side of curr, N, S, E, W.
+    width = maze.width
+    walls = maze.grid.cells[curr]
+    y, x = divmod(curr, width)
+    found = []
+    if y > 0 and not walls & NORTH:
+        found.append((curr - width, NORTH))
+    if y + 1 < maze.height and not walls & SOUTH:
+        found.append((curr + width, SOUTH))
+    if x + 1 < width and not walls & EAST:
+        found.append((curr + 1, EAST))
+    if x > 0 and not walls & WEST:
+        found.append((curr - 1, WEST))
+    return found
+
+
+def _in_bounds(maze: 'MazeGenerator', *cells: tuple[int, int]) -> bool:
+    # Check that every (x, y) lies inside the maze.
+    return all(
+        0 <= x < maze.width and 0 <= y < maze.height for x, y in cells)
+
+
+def solve_bfs(
+    maze: 'MazeGenerator',
+    start: tuple[int, int],
+    exit: tuple[int, int],
+    stats: Optional[dict[str, int]] = None,
+) -> list[tuple[int, int]]:
+    # Plain breadth-first search, the reference every solver must match.
+    return maze.solve_bfs(start, exit, stats)
+
+
+def solve_astar(
+    maze: 'MazeGenerator',
+    start: tuple[int, int],
+    exit: tuple[int, int],
+    stats: Optional[dict[str, int]] = None,
+) -> list[tuple[int, int]]:
+    # A* with the Manhattan distance to the exit as heuristic. Ties on f go
+    # to the deeper cell, which keeps corridors from being expanded twice.
+    if not _in_bounds(maze, start, exit):
+        return []
+    width = maze.width
+    ex, ey = exit
+    start_id = start[1] * width + start[0]
+    exit_id = ey * width + ex
+    came_from = bytearray(width * maze.height)
+    came_from[start_id] = START
+    closed = bytearray(width * maze.height)
+    best = {start_id: 0}
+    heap = [(abs(start[0] - ex) + abs(start[1] - ey), 0, start_id)]
+    expanded = 0
+
+    while heap:
+        _, neg_g, curr = heapq.heappop(heap)
+        if closed[curr]:
+            continue
+        closed[curr] = 1
+        expanded += 1
+        if curr == exit_id:
+            break
+        g = -neg_g + 1
+        for nxt, direction in _open_neighbors(maze, curr):
+            if closed[nxt] or best.get(nxt, g + 1) <= g:
+                continue
+            best[nxt] = g
+            came_from[nxt] = direction
+            ny, nx = divmod(nxt, width)
+            heapq.heappush(heap, (g + abs(nx - ex) + abs(ny - ey), -g, nxt))
+
+    if stats is not None:
+        stats['expanded'] = expanded
+    if not closed[exit_id]:
+        return []
+    return maze.find_path(came_from, exit)
+
+
+def solve_bidirectional(
+    maze: 'MazeGenerator',
+    start: tuple[int, int],
+    exit: tuple[int, int],
+    stats: Optional[dict[str, int]] = None,
+) -> list[tuple[int, int]]:
+    # Breadth-first search from both ends, always growing the smaller
+    # frontier by one full level, until the two searches meet.
+    if not _in_bounds(maze, start, exit):
+        return []
+    width = maze.width
+    start_id = start[1] * width + start[0]
+    exit_id = exit[1] * width + exit[0]
+    forward = bytearray(width * maze.height)
+    backward = bytearray(width * maze.height)
+    forward[start_id] = START
+    backward[exit_id] = START
+    fronts = ([start_id], [exit_id])
+    seen = (forward, backward)
+    expanded = 0
+    meet = start_id if start_id == exit_id else -1
+
+    while meet == -1 and fronts[0] and fronts[1]:
+        side = 0 if len(fronts[0]) <= len(fronts[1]) else 1
+        mine, other = seen[side], seen[1 - side]
+        level = []
+        for curr in fronts[side]:
+            expanded += 1
+            for nxt, direction in _open_neighbors(maze, curr):
+                if mine[nxt]:
+                    continue
+                mine[nxt] = direction
+                level.append(nxt)
+                if other[nxt]:
+                    meet = nxt
+                    break
+            if meet != -1:
+                break
+        fronts = (level, fronts[1]) if side == 0 else (fronts[0], level)
+
+    if stats is not None:
+        stats['expanded'] = expanded
+    if meet == -1:
+        return []
+
+    # Forward half from the start, then follow the backward search to exit
+    path = maze.find_path(forward, maze.grid.coords(meet))
+    curr = meet
+    while backward[curr] != START:
+        dx, dy = DIRECTION_D[backward[curr]]
+        curr -= dy * width + dx
+        path.append(maze.grid.coords(curr))
+    return path
+
+
+def solve_dead_end_fill(
+    maze: 'MazeGenerator',
+    start: tuple[int, int],
+    exit: tuple[int, int],
+    stats: Optional[dict[str, int]] = None,
+) -> list[tuple[int, int]]:
+    # Fill every dead end (and the corridors it leaves behind) so that only
+    # cells that can lie on a start-exit path remain, then run BFS over them.
+    if not _in_bounds(maze, start, exit):
+        return []
+    width = maze.width
+    cells = maze.grid.cells
+    start_id = start[1] * width + start[0]
+    exit_id = exit[1] * width + exit[0]
+    degree = bytearray(cells.translate(OPEN_COUNT))
+    filled = bytearray(width * maze.height)
+    pending = []
+    cell = degree.find(1)
+    while cell != -1:
+        if cell != start_id and cell != exit_id:
+            pending.append(cell)
+        cell = degree.find(1, cell + 1)
+    expanded = 0
+    while pending:
+        curr = pending.pop()
+        filled[curr] = 1
+        expanded += 1
+        for nxt, _ in _open_neighbors(maze, curr):
+            if filled[nxt]:
+                continue
+            degree[nxt] -= 1
+            if degree[nxt] == 1 and nxt != start_id and nxt != exit_id:
+                pending.append(nxt)
+
+    # Breadth-first search restricted to the cells left open
+    came_from = bytearray(filled.translate(FILLED_AS_VISITED))
+    came_from[start_id] = START
+    queue = deque([start_id])
+    while queue:
+        curr = queue.popleft()
+        expanded += 1
+        if curr == exit_id:
+            if stats is not None:
+                stats['expanded'] = expanded
+            return maze.find_path(came_from, exit)
+        for nxt, direction in _open_neighbors(maze, curr):
+            if not came_from[nxt]:
+                came_from[nxt] = direction
+                queue.append(nxt)
+    if stats is not None:
+        stats['expanded'] = expanded
+    return []
+
+
+# Solver function for each SOLVER config value
+SOLVERS: dict[str, Solver] = {
+    "bfs": solve_bfs,
+    "astar": solve_astar,
+    "bibfs": solve_bidirectional,
+    "deadend": solve_dead_end_fill,
+}